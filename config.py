@@ -1,13 +1,18 @@
 """番茄钟配置文件"""
 
 import os
+from typing import Optional
 
 
 class Config:
     """应用配置"""
 
-    @staticmethod
-    def get_timer_duration() -> int:
+    # 环境变量在进程启动后不会变化，首次读取后缓存
+    _duration_cached: Optional[int] = None
+    _test_mode_cached: Optional[bool] = None
+
+    @classmethod
+    def get_timer_duration(cls) -> int:
         """
         获取番茄钟时长（秒）
 
@@ -20,8 +25,28 @@ class Config:
             POMODORO_DURATION_SECONDS: 设置番茄钟时长（秒）
             POMODORO_TEST_MODE: 设置为 'true' 启用10秒测试模式
         """
+        if cls._duration_cached is None:
+            cls._duration_cached = cls._load_timer_duration()
+        return cls._duration_cached
+
+    @classmethod
+    def is_test_mode(cls) -> bool:
+        """是否为测试模式"""
+        if cls._test_mode_cached is None:
+            cls._test_mode_cached = os.getenv('POMODORO_TEST_MODE', '').lower() == 'true'
+        return cls._test_mode_cached
+
+    @classmethod
+    def invalidate(cls):
+        """清除缓存，下次访问时重新读取环境变量（用于测试）"""
+        cls._duration_cached = None
+        cls._test_mode_cached = None
+
+    @classmethod
+    def _load_timer_duration(cls) -> int:
+        """从环境变量解析番茄钟时长"""
         # 检查测试模式环境变量
-        if os.getenv('POMODORO_TEST_MODE', '').lower() == 'true':
+        if cls.is_test_mode():
             print("⚠️  测试模式已启用：番茄钟时长 = 10秒")
             return 10
 
@@ -37,8 +62,3 @@ class Config:
 
         # 默认30分钟
         return 30 * 60
-
-    @staticmethod
-    def is_test_mode() -> bool:
-        """是否为测试模式"""
-        return os.getenv('POMODORO_TEST_MODE', '').lower() == 'true'
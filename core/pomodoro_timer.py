@@ -1,16 +1,32 @@
 """番茄钟计时器 - 倒计时逻辑和状态管理。"""
 
+import math
 import time
 import threading
+from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, Callable
 from datetime import datetime
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+
+# 预先格式化的 MM:SS 字符串，按剩余秒数索引（覆盖 0 ~ 99:59）
+_MMSS_TABLE = tuple("%02d:%02d" % divmod(s, 60) for s in range(100 * 60))
 
 
 class PomodoroTimerSignals(QObject):
-    """计时器信号"""
-    completed = pyqtSignal()  # 完成信号
+    """计时器信号（所有计时器实例共享同一个对象）"""
+    completed = pyqtSignal(object)  # 完成信号，参数为完成的计时器
+
+    _shared: Optional['PomodoroTimerSignals'] = None
+
+    @classmethod
+    def shared(cls) -> 'PomodoroTimerSignals':
+        """获取共享的信号对象，首次调用时创建"""
+        if cls._shared is None:
+            cls._shared = cls()
+            cls._shared.completed.connect(lambda timer: timer._on_completed_signal())
+        return cls._shared
 
 
 class TimerState(Enum):
@@ -22,8 +38,14 @@ class TimerState(Enum):
     ABANDONED = "已废弃"
 
 
-class PomodoroTimer:
-    """番茄钟计时器"""
+class PomodoroTimerBase(ABC):
+    """
+    番茄钟计时器基类
+
+    负责状态机、时长与剩余时间计算；计时驱动（线程或Qt事件循环）
+    由子类通过抽象方法 _start_worker / _pause_worker / _resume_worker /
+    _stop_worker / _emit_complete 实现，缺少实现的子类无法实例化。
+    """
 
     DEFAULT_DURATION = 30 * 60  # 默认30分钟（秒）
 
@@ -38,25 +60,15 @@ class PomodoroTimer:
         self._duration = duration_seconds if duration_seconds is not None else self.DEFAULT_DURATION
         self._remaining_seconds = self._duration
         self._current_task_id: Optional[int] = None
-        self._start_time: Optional[str] = None
-        self._timer_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
-        self._pause_event = threading.Event()
-
-        # 信号对象（用于线程安全的回调）
-        self._signals = PomodoroTimerSignals()
-        self._signals.completed.connect(self._on_completed_signal)
+        self._start_dt: Optional[datetime] = None
+        self._deadline = 0.0  # 计时结束的 monotonic 时间点
+        self._pause_started = 0.0  # 暂停开始的 monotonic 时间点
 
         # 回调函数
         self._on_tick: Optional[Callable[[int, int], None]] = None  # (剩余秒数, 总秒数)
         self._on_complete: Optional[Callable[[], None]] = None
         self._on_state_change: Optional[Callable[[TimerState], None]] = None
 
-    def _on_completed_signal(self):
-        """完成信号的槽函数（在主线程中执行）"""
-        if self._on_complete:
-            self._on_complete()
-
     @property
     def state(self) -> TimerState:
         """获取当前状态"""
@@ -77,6 +89,11 @@ class PomodoroTimer:
         """获取当前任务ID"""
         return self._current_task_id
 
+    @property
+    def start_time(self) -> Optional[str]:
+        """获取本轮计时开始时间（ISO格式），未开始则返回None"""
+        return self._start_dt.isoformat() if self._start_dt else None
+
     @property
     def is_running(self) -> bool:
         """是否正在运行"""
@@ -151,9 +168,10 @@ class PomodoroTimer:
             return False
 
         if self._state == TimerState.PAUSED:
-            # 从暂停恢复
+            # 从暂停恢复，截止时间顺延暂停时长
+            self._deadline += time.monotonic() - self._pause_started
             self._set_state(TimerState.RUNNING)
-            self._pause_event.clear()  # 清除暂停标志，让线程继续
+            self._resume_worker()
             return True
 
         # 新的计时
@@ -161,15 +179,11 @@ class PomodoroTimer:
             return False
 
         self._remaining_seconds = self._duration
-        self._start_time = datetime.now().isoformat()
-        self._stop_event.clear()
-        self._pause_event.clear()
+        self._start_dt = datetime.now()
+        self._deadline = time.monotonic() + self._duration
 
         self._set_state(TimerState.RUNNING)
-
-        # 启动计时线程
-        self._timer_thread = threading.Thread(target=self._run_timer, daemon=True)
-        self._timer_thread.start()
+        self._start_worker()
 
         return True
 
@@ -183,8 +197,9 @@ class PomodoroTimer:
         if self._state != TimerState.RUNNING:
             return False
 
+        self._pause_started = time.monotonic()
         self._set_state(TimerState.PAUSED)
-        self._pause_event.set()  # 设置暂停标志，让线程进入等待
+        self._pause_worker()
         return True
 
     def resume(self) -> bool:
@@ -209,12 +224,7 @@ class PomodoroTimer:
         if self._state not in (TimerState.RUNNING, TimerState.PAUSED):
             return False
 
-        # 停止计时线程
-        self._stop_event.set()
-        self._pause_event.clear()
-
-        if self._timer_thread and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=1.0)
+        self._stop_worker()
 
         if abandon:
             self._set_state(TimerState.ABANDONED)
@@ -235,12 +245,7 @@ class PomodoroTimer:
         if self._state not in (TimerState.RUNNING, TimerState.PAUSED):
             return False
 
-        # 停止计时线程
-        self._stop_event.set()
-        self._pause_event.clear()
-
-        if self._timer_thread and self._timer_thread.is_alive():
-            self._timer_thread.join(timeout=1.0)
+        self._stop_worker()
 
         self._remaining_seconds = 0
         self._set_state(TimerState.COMPLETED)
@@ -256,8 +261,26 @@ class PomodoroTimer:
             self.stop(abandon=True)
 
         self._remaining_seconds = self._duration
-        self._start_time = None
+        self._start_dt = None
+        self._set_state(TimerState.READY)
+
+    def stop_and_reset(self) -> bool:
+        """
+        废弃当前计时并直接回到初始状态
+
+        等价于 stop(abandon=True) 后再 reset()，但只触发一次状态回调。
+
+        Returns:
+            是否停止了进行中的计时
+        """
+        stopped = self._state in (TimerState.RUNNING, TimerState.PAUSED)
+        if stopped:
+            self._stop_worker()
+
+        self._remaining_seconds = self._duration
+        self._start_dt = None
         self._set_state(TimerState.READY)
+        return stopped
 
     def get_formatted_time(self) -> str:
         """
@@ -266,8 +289,11 @@ class PomodoroTimer:
         Returns:
             MM:SS 格式的时间字符串
         """
-        minutes = self._remaining_seconds // 60
-        seconds = self._remaining_seconds % 60
+        remaining = self._remaining_seconds
+        if 0 <= remaining < len(_MMSS_TABLE):
+            return _MMSS_TABLE[remaining]
+
+        minutes, seconds = divmod(remaining, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     def get_progress_percentage(self) -> float:
@@ -282,46 +308,234 @@ class PomodoroTimer:
         elapsed = self._duration - self._remaining_seconds
         return (elapsed / self._duration) * 100
 
+    # ==================== 计时驱动 ====================
+
+    @abstractmethod
+    def _start_worker(self):
+        """开始新一轮计时"""
+
+    @abstractmethod
+    def _pause_worker(self):
+        """暂停计时"""
+
+    @abstractmethod
+    def _resume_worker(self):
+        """恢复计时"""
+
+    @abstractmethod
+    def _stop_worker(self):
+        """停止计时"""
+
+    @abstractmethod
+    def _emit_complete(self):
+        """自然完成时触发完成回调"""
+
+    def _advance(self) -> float:
+        """
+        按截止时间刷新剩余秒数并触发tick回调
+
+        剩余时间由绝对截止时间推算，而不是每秒递减，避免长时间运行累积误差。
+
+        Returns:
+            距截止时间的精确剩余秒数（可能为负）
+        """
+        remaining = self._deadline - time.monotonic()
+        self._remaining_seconds = max(0, math.ceil(remaining))
+
+        # 触发tick回调（包括0秒的情况）
+        if self._on_tick:
+            self._on_tick(self._remaining_seconds, self._duration)
+
+        return remaining
+
+    def _finish(self):
+        """计时自然结束"""
+        self._remaining_seconds = 0
+        self._set_state(TimerState.COMPLETED)
+        self._emit_complete()
+
+    def _set_state(self, new_state: TimerState):
+        """
+        设置状态并触发回调
+
+        Args:
+            new_state: 新状态
+        """
+        if self._state != new_state:
+            self._state = new_state
+            if self._on_state_change:
+                self._on_state_change(new_state)
+
+
+class PomodoroTimer(PomodoroTimerBase):
+    """番茄钟计时器（后台线程驱动，不依赖Qt事件循环运行）"""
+
+    def __init__(self, duration_seconds: int = None):
+        """
+        初始化计时器
+
+        Args:
+            duration_seconds: 计时时长（秒），None则使用默认30分钟
+        """
+        super().__init__(duration_seconds)
+        # 常驻计时线程：首次开始时创建，之后每轮计时复用
+        self._timer_thread: Optional[threading.Thread] = None
+        self._run_event = threading.Event()  # 通知线程开始新一轮计时
+        self._stop_event = threading.Event()
+        self._pause_event = threading.Event()
+        self._exited = threading.Event()  # 本轮倒计时已结束标志
+        self._exited.set()
+        self._shutdown = False
+
+        # 信号对象（用于线程安全的回调）
+        self._signals = PomodoroTimerSignals.shared()
+
+    def _on_completed_signal(self):
+        """完成信号的槽函数（在主线程中执行）"""
+        if self._on_complete:
+            self._on_complete()
+
+    def shutdown(self):
+        """停止计时并结束常驻计时线程"""
+        self._shutdown = True
+        self._stop_event.set()
+        self._run_event.set()
+
+    def _start_worker(self):
+        """开始新一轮计时：唤醒常驻计时线程（必要时先创建）"""
+        # 确保上一轮倒计时已完全退出，避免与新一轮重叠
+        self._exited.wait(timeout=1.0)
+
+        # shutdown() 后旧线程即将退出，不能复用：等待其结束后重新创建
+        # （stop_event 已置位，线程会立即醒来退出，join 不会长时间阻塞）
+        if self._shutdown and self._timer_thread is not None:
+            self._timer_thread.join()
+            self._timer_thread = None
+
+        self._stop_event.clear()
+        self._pause_event.clear()
+        self._exited.clear()
+
+        if self._timer_thread is None or not self._timer_thread.is_alive():
+            self._shutdown = False
+            self._timer_thread = threading.Thread(target=self._run_timer, daemon=True)
+            self._timer_thread.start()
+
+        self._run_event.set()
+
+    def _pause_worker(self):
+        """暂停计时：设置暂停标志，让线程进入等待"""
+        self._pause_event.set()
+
+    def _resume_worker(self):
+        """恢复计时：清除暂停标志，让线程继续"""
+        self._pause_event.clear()
+
+    def _stop_worker(self):
+        """
+        停止计时线程
+
+        线程在 stop_event 上等待，设置后会立即醒来并标记退出，
+        因此这里只需短暂等待退出标志，无需 join。
+        """
+        self._stop_event.set()
+        self._pause_event.clear()
+        self._exited.wait(timeout=0.05)
+
+    def _emit_complete(self):
+        """自然完成时触发完成回调（通过信号回到主线程，线程安全）"""
+        self._signals.completed.emit(self)
+
     def _run_timer(self):
-        """计时器线程执行函数"""
-        iteration = 0
-        while not self._stop_event.is_set():
-            iteration += 1
+        """常驻计时线程执行函数：等待开始信号，执行一轮倒计时后继续等待"""
+        while True:
+            self._run_event.wait()
+            self._run_event.clear()
+            if self._shutdown:
+                break
+
+            try:
+                self._run_countdown()
+            finally:
+                self._exited.set()
+
+        self._exited.set()
 
-            # 检查暂停
+    def _run_countdown(self):
+        """倒计时循环，直到自然完成或被停止"""
+        while not self._stop_event.is_set():
+            # 检查暂停（暂停期间截止时间在恢复时顺延）
             if self._pause_event.is_set():
-                self._pause_event.wait()  # 阻塞直到恢复
+                self._stop_event.wait(0.1)
                 continue
 
-            # 触发tick回调（包括0秒的情况）
-            if self._on_tick:
-                self._on_tick(self._remaining_seconds, self._duration)
+            remaining = self._advance()
 
             # 检查是否完成
-            if self._remaining_seconds <= 0:
+            if remaining <= 0:
                 # 计时完成，退出循环
                 break
 
-            # 等待1秒（或被stop_event中断）
-            self._stop_event.wait(1.0)
-            self._remaining_seconds -= 1
+            # 等待到下一个整秒边界（或被stop_event中断）
+            self._stop_event.wait(remaining - self._remaining_seconds + 1)
 
         # 检查是否自然完成（未中途停止）
         if not self._stop_event.is_set() and self._remaining_seconds <= 0:
-            self._remaining_seconds = 0
-            self._set_state(TimerState.COMPLETED)
+            self._finish()
 
-            # 使用信号机制触发完成回调（线程安全）
-            self._signals.completed.emit()
 
-    def _set_state(self, new_state: TimerState):
+class QtPomodoroTimer(PomodoroTimerBase):
+    """
+    由Qt事件循环驱动的番茄钟计时器
+
+    使用单次 QTimer 在每个整秒边界触发，不创建后台线程，
+    所有回调都在主线程中执行。需要运行中的Qt事件循环。
+    """
+
+    def __init__(self, duration_seconds: int = None):
         """
-        设置状态并触发回调
+        初始化计时器
 
         Args:
-            new_state: 新状态
+            duration_seconds: 计时时长（秒），None则使用默认30分钟
         """
-        if self._state != new_state:
-            self._state = new_state
-            if self._on_state_change:
-                self._on_state_change(new_state)
+        super().__init__(duration_seconds)
+        self._qtimer = QTimer()
+        self._qtimer.setSingleShot(True)
+        self._qtimer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._qtimer.timeout.connect(self._on_qt_timeout)
+
+    def _start_worker(self):
+        """开始新一轮计时：立即触发首次tick"""
+        self._qtimer.start(0)
+
+    def _pause_worker(self):
+        """暂停计时"""
+        self._qtimer.stop()
+
+    def _resume_worker(self):
+        """恢复计时"""
+        self._qtimer.start(0)
+
+    def _stop_worker(self):
+        """停止计时"""
+        self._qtimer.stop()
+
+    def _emit_complete(self):
+        """自然完成时触发完成回调（已在主线程中）"""
+        if self._on_complete:
+            self._on_complete()
+
+    def _on_qt_timeout(self):
+        """QTimer 超时：刷新剩余时间并安排下一个整秒边界"""
+        if self._state != TimerState.RUNNING:
+            return
+
+        remaining = self._advance()
+        if remaining <= 0:
+            self._finish()
+            return
+
+        # 向上取整到毫秒，避免在整秒边界之前触发而重复同一秒的tick
+        wait_seconds = remaining - self._remaining_seconds + 1
+        self._qtimer.start(max(1, math.ceil(wait_seconds * 1000)))
@@ -1,6 +1,9 @@
 """统计模块 - 数据统计和历史计算。"""
 
-from typing import Dict, List, Optional
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from itertools import groupby
 from datetime import datetime, timedelta
 from calendar import monthcalendar, monthrange
 from data.storage import Storage
@@ -57,19 +60,20 @@ class MonthlyStatistics:
         """
         self.year = year
         self.month = month
-        self.days_with_data: Dict[str, int] = {}  # {日期: 番茄钟数}
+        # 按日号(1-31)索引的番茄钟数，下标0不使用
+        self.days_with_data = array('H', [0] * 32)
         self.total_pomodoros = 0
         self.days_with_pomodoros = 0
 
-    def add_day(self, day: str, pomodoro_count: int):
+    def add_day(self, day: Union[int, str], pomodoro_count: int):
         """
         添加某天的数据
 
         Args:
-            day: 日期 (DD)
+            day: 日号 (1-31 或 'DD')
             pomodoro_count: 番茄钟数量
         """
-        self.days_with_data[day] = pomodoro_count
+        self.days_with_data[int(day)] = pomodoro_count
         self.total_pomodoros += pomodoro_count
         if pomodoro_count > 0:
             self.days_with_pomodoros += 1
@@ -90,7 +94,10 @@ class MonthlyStatistics:
         return {
             'year': self.year,
             'month': self.month,
-            'days_with_data': self.days_with_data,
+            'days_with_data': {
+                f"{day:02d}": count
+                for day, count in enumerate(self.days_with_data) if day and count
+            },
             'total_pomodoros': self.total_pomodoros,
             'days_with_pomodoros': self.days_with_pomodoros,
             'average_daily': self.get_average_daily()
@@ -100,6 +107,8 @@ class MonthlyStatistics:
 class Statistics:
     """统计管理器"""
 
+    MONTH_CACHE_SIZE = 24  # 最多缓存的月份数
+
     def __init__(self, storage: Storage):
         """
         初始化统计管理器
@@ -108,6 +117,11 @@ class Statistics:
             storage: 数据存储对象
         """
         self.storage = storage
+        # 不限范围的番茄钟总数缓存：(会话版本号, 总数)
+        self._total_cache: Optional[Tuple[int, int]] = None
+        # 月度每日番茄钟数缓存（LRU），会话写入后整体失效
+        self._month_cache: 'OrderedDict[Tuple[int, int], Dict[str, int]]' = OrderedDict()
+        self._month_cache_version = storage.sessions_version
 
     def get_daily_statistics(self, date: str) -> DailyStatistics:
         """
@@ -133,21 +147,14 @@ class Statistics:
                 task_pomodoros[task_id] = task_pomodoros.get(task_id, 0) + 1
 
         # 获取真正已完成的任务（通过completed_date判断）
-        all_tasks = self.storage.get_all_tasks(include_completed=True)
         completed_tasks = []
-
-        for task in all_tasks:
-            # 检查任务是否在当日完成
-            if task.get('is_completed'):
-                completed_date = task.get('completed_date', '')
-                if completed_date and completed_date.startswith(date):
-                    pomodoros = task_pomodoros.get(task['id'], 0)
-                    completed_tasks.append({
-                        'id': task['id'],
-                        'description': task['description'],
-                        'pomodoros': pomodoros,
-                        'quadrant': task['quadrant']
-                    })
+        for task in self.storage.get_tasks_completed_on(date):
+            completed_tasks.append({
+                'id': task['id'],
+                'description': task['description'],
+                'pomodoros': task_pomodoros.get(task['id'], 0),
+                'quadrant': task['quadrant']
+            })
 
         # 获取该日结束时各象限未完成任务数量
         pending_counts = self.storage.get_pending_task_counts_by_quadrant(date)
@@ -179,13 +186,41 @@ class Statistics:
             月度统计对象
         """
         monthly_stats = MonthlyStatistics(year, month)
-        daily_counts = self.storage.get_monthly_pomodoro_counts(year, month)
+        daily_counts = self._get_monthly_pomodoro_counts(year, month)
 
         for day, count in daily_counts.items():
             monthly_stats.add_day(day, count)
 
         return monthly_stats
 
+    def _get_monthly_pomodoro_counts(self, year: int, month: int) -> Dict[str, int]:
+        """
+        获取指定月份每天的番茄钟数量（带缓存）
+
+        Args:
+            year: 年份
+            month: 月份 (1-12)
+
+        Returns:
+            {日期(DD): 番茄钟数量}
+        """
+        version = self.storage.sessions_version
+        if version != self._month_cache_version:
+            self._month_cache.clear()
+            self._month_cache_version = version
+
+        key = (year, month)
+        daily_counts = self._month_cache.get(key)
+        if daily_counts is None:
+            daily_counts = self.storage.get_monthly_pomodoro_counts(year, month)
+            self._month_cache[key] = daily_counts
+            if len(self._month_cache) > self.MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
+        else:
+            self._month_cache.move_to_end(key)
+
+        return daily_counts
+
     def get_weekly_statistics(self, start_date: str) -> Dict[str, int]:
         """
         获取一周的统计信息
@@ -196,15 +231,11 @@ class Statistics:
         Returns:
             {日期: 番茄钟数}
         """
-        weekly_data = {}
         start = datetime.strptime(start_date, "%Y-%m-%d")
+        dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7)]
 
-        for i in range(7):
-            date = (start + timedelta(days=i)).strftime("%Y-%m-%d")
-            count = self.storage.get_daily_pomodoro_count(date)
-            weekly_data[date] = count
-
-        return weekly_data
+        counts = self.storage.get_pomodoro_counts_in_range(dates[0], dates[-1])
+        return {date: counts.get(date, 0) for date in dates}
 
     def get_total_pomodoros(self, start_date: Optional[str] = None,
                            end_date: Optional[str] = None) -> int:
@@ -218,19 +249,14 @@ class Statistics:
         Returns:
             番茄钟总数
         """
-        # 这里简化实现，如果需要精确范围可以在storage层添加
-        if not start_date and not end_date:
-            # 获取所有数据的总和
-            cursor = self.storage.conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) as count FROM pomodoro_sessions
-                WHERE status = 'completed'
-            """)
-            row = cursor.fetchone()
-            return row['count'] if row else 0
+        if start_date or end_date:
+            return self.storage.get_total_pomodoro_count(start_date, end_date)
 
-        # TODO: 实现日期范围查询
-        return 0
+        # 不限范围时复用缓存，会话写入后版本号变化即失效
+        version = self.storage.sessions_version
+        if self._total_cache is None or self._total_cache[0] != version:
+            self._total_cache = (version, self.storage.get_total_pomodoro_count())
+        return self._total_cache[1]
 
     def get_task_statistics(self, task_id: int) -> Dict:
         """
@@ -248,20 +274,15 @@ class Statistics:
 
         sessions = self.storage.get_pomodoro_sessions_by_task(task_id)
 
-        # 将is_completed转换为布尔值
-        is_completed = task.get('is_completed', False)
-        if isinstance(is_completed, int):
-            is_completed = bool(is_completed)
-
         return {
             'task_id': task_id,
             'description': task['description'],
             'quadrant': task['quadrant'],
-            'estimated_pomodoros': task.get('estimated_pomodoros', 0),
+            'estimated_pomodoros': task['estimated_pomodoros'] or 0,
             'actual_pomodoros': len(sessions),
-            'is_completed': is_completed,
+            'is_completed': bool(task['is_completed']),
             'created_date': task['created_date'],
-            'completed_date': task.get('completed_date'),
+            'completed_date': task['completed_date'],
             'sessions': sessions
         }
 
@@ -275,55 +296,35 @@ class Statistics:
                 'longest_streak': 最长连续天数
             }
         """
-        cursor = self.storage.conn.cursor()
-
-        # 获取所有有番茄钟的日期
-        cursor.execute("""
-            SELECT date, COUNT(*) as count
-            FROM pomodoro_sessions
-            WHERE status = 'completed'
-            GROUP BY date
-            ORDER BY date DESC
-        """)
+        with self.storage.read_cursor() as cursor:
+            # 获取所有有番茄钟的日期
+            cursor.execute("""
+                SELECT date, COUNT(*) as count
+                FROM pomodoro_sessions
+                WHERE status = 'completed'
+                GROUP BY date
+                ORDER BY date DESC
+            """)
 
-        dates = [row['date'] for row in cursor.fetchall()]
+            dates = [row['date'] for row in cursor.fetchall()]
 
         if not dates:
             return {'current_streak': 0, 'longest_streak': 0}
 
-        current_streak = 0
-        longest_streak = 0
-        temp_streak = 0
+        # 日期按降序排列，连续的日期满足 序数 + 下标 为常数，
+        # 据此用 groupby 一次性切分出所有连续区间
+        ordinals = [datetime.fromisoformat(d).toordinal() for d in dates]
+        run_lengths = [
+            sum(1 for _ in group)
+            for _, group in groupby(o + i for i, o in enumerate(ordinals))
+        ]
 
-        today = datetime.now().date()
-
-        # 计算当前连续天数（从今天开始向回检查）
-        for i, date_str in enumerate(dates):
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            expected_date = today - timedelta(days=i)
-
-            if date == expected_date:
-                current_streak += 1
-            else:
-                break
-
-        # 计算最长连续天数
-        if len(dates) > 0:
-            temp_streak = 1
-            longest_streak = 1
-
-            for i in range(1, len(dates)):
-                curr_date = datetime.strptime(dates[i], "%Y-%m-%d").date()
-                prev_date = datetime.strptime(dates[i - 1], "%Y-%m-%d").date()
-
-                # 检查相邻日期是否连续（前一个日期 - 当前日期 = 1天）
-                if (prev_date - curr_date).days == 1:
-                    temp_streak += 1
-                else:
-                    temp_streak = 1
+        # 当前连续天数：第一个区间从今天开始才算
+        today = datetime.now().date().toordinal()
+        current_streak = run_lengths[0] if ordinals[0] == today else 0
 
-                if temp_streak > longest_streak:
-                    longest_streak = temp_streak
+        # 最长连续天数
+        longest_streak = max(run_lengths)
 
         return {
             'current_streak': current_streak,
@@ -343,13 +344,11 @@ class Statistics:
                 }
             }
         """
-        all_tasks = self.storage.get_all_tasks(include_completed=True)
+        counts = self.storage.get_quadrant_counts()
 
         distribution = {}
         for q in range(4):
-            quadrant_tasks = [t for t in all_tasks if t['quadrant'] == q]
-            pending = len([t for t in quadrant_tasks if not bool(t.get('is_completed', False))])
-            completed = len([t for t in quadrant_tasks if bool(t.get('is_completed', False))])
+            pending, completed = counts[q]
             total = pending + completed
 
             completion_rate = (completed / total * 100) if total > 0 else 0.0
@@ -377,8 +376,8 @@ class Statistics:
         # 获取月份日历布局
         cal = monthcalendar(year, month)
 
-        # 获取该月的番茄钟数据
-        daily_counts = self.storage.get_monthly_pomodoro_counts(year, month)
+        # 获取该月的番茄钟数据（按日号索引）
+        daily_counts = self.get_monthly_statistics(year, month).days_with_data
 
         # 构建日历矩阵
         calendar_data = []
@@ -388,8 +387,7 @@ class Statistics:
                 if day == 0:
                     week_data.append(None)
                 else:
-                    day_key = f"{day:02d}"
-                    week_data.append(daily_counts.get(day_key, 0))
+                    week_data.append(daily_counts[day])
             calendar_data.append(week_data)
 
         return calendar_data
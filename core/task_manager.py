@@ -1,6 +1,6 @@
 """任务管理器 - 处理任务的增删改查和象限逻辑。"""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional
 from datetime import datetime
 from data.storage import Storage, Quadrant
 
@@ -8,6 +8,10 @@ from data.storage import Storage, Quadrant
 class Task:
     """任务数据类"""
 
+    __slots__ = ('id', 'description', 'created_date', 'quadrant',
+                 'estimated_pomodoros', 'completed_date', 'actual_pomodoros',
+                 'is_completed')
+
     def __init__(self, task_id: int, description: str, created_date: str,
                  quadrant: int, estimated_pomodoros: int = 0,
                  completed_date: Optional[str] = None, actual_pomodoros: int = 0,
@@ -22,23 +26,14 @@ class Task:
         self.is_completed = is_completed
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Task':
-        """从字典创建Task对象"""
-        # 将SQLite返回的整数转换为布尔值
-        is_completed = data.get('is_completed', False)
-        if isinstance(is_completed, int):
-            is_completed = bool(is_completed)
-
-        return cls(
-            task_id=data['id'],
-            description=data['description'],
-            created_date=data['created_date'],
-            quadrant=data['quadrant'],
-            estimated_pomodoros=data.get('estimated_pomodoros', 0),
-            completed_date=data.get('completed_date'),
-            actual_pomodoros=data.get('actual_pomodoros', 0),
-            is_completed=is_completed
-        )
+    def from_dict(cls, data: Mapping) -> 'Task':
+        """从字典或 sqlite3.Row 创建Task对象（需包含 tasks 表全部列）"""
+        # 按构造函数参数顺序传位置参数；计数列可能为NULL，以0兜底
+        return cls(data['id'], data['description'], data['created_date'],
+                   data['quadrant'], data['estimated_pomodoros'] or 0,
+                   data['completed_date'], data['actual_pomodoros'] or 0,
+                   # 将SQLite返回的整数转换为布尔值
+                   bool(data['is_completed']))
 
     def to_dict(self) -> Dict:
         """转换为字典"""
@@ -57,21 +52,21 @@ class Task:
 class TaskManager:
     """任务管理器"""
 
-    # 象限名称映射
-    QUADRANT_NAMES = {
-        0: "重要紧急",
-        1: "重要不紧急",
-        2: "紧急不重要",
-        3: "不紧急不重要"
-    }
-
-    # 象限颜色映射
-    QUADRANT_COLORS = {
-        0: "#FF6B6B",  # 红色
-        1: "#FFD93D",  # 黄色
-        2: "#4D96FF",  # 蓝色
-        3: "#A0A0A0"   # 灰色
-    }
+    # 象限名称，按象限编号 (0-3) 索引
+    QUADRANT_NAMES = (
+        "重要紧急",
+        "重要不紧急",
+        "紧急不重要",
+        "不紧急不重要"
+    )
+
+    # 象限颜色，按象限编号 (0-3) 索引
+    QUADRANT_COLORS = (
+        "#FF6B6B",  # 红色
+        "#FFD93D",  # 黄色
+        "#4D96FF",  # 蓝色
+        "#A0A0A0"   # 灰色
+    )
 
     def __init__(self, storage: Storage):
         """
@@ -82,6 +77,11 @@ class TaskManager:
         """
         self.storage = storage
 
+    @property
+    def version(self) -> int:
+        """任务数据版本号，任何任务写入后递增"""
+        return self.storage.tasks_version
+
     def create_task(self, description: str, quadrant: int,
                     estimated_pomodoros: int = 0) -> Task:
         """
@@ -104,26 +104,26 @@ class TaskManager:
         if not description or not description.strip():
             raise ValueError("任务描述不能为空")
 
-        task_id = self.storage.create_task(
+        task_data = self.storage.create_task_row(
             description=description.strip(),
             quadrant=quadrant,
             estimated_pomodoros=estimated_pomodoros
         )
 
-        task_data = self.storage.get_task(task_id)
         return Task.from_dict(task_data)
 
-    def get_task(self, task_id: int) -> Optional[Task]:
+    def get_task(self, task_id: int, cache: bool = False) -> Optional[Task]:
         """
         获取指定任务
 
         Args:
             task_id: 任务ID
+            cache: 是否允许使用存储层的任务缓存（适合界面反复读取同一任务）
 
         Returns:
             任务对象，不存在则返回None
         """
-        task_data = self.storage.get_task(task_id)
+        task_data = self.storage.get_task(task_id, cache=cache)
         if task_data:
             return Task.from_dict(task_data)
         return None
@@ -162,6 +162,23 @@ class TaskManager:
         tasks_data = self.storage.get_tasks_by_quadrant(quadrant, include_completed)
         return [Task.from_dict(t) for t in tasks_data]
 
+    def get_tasks_grouped_by_quadrant(self,
+                                      include_completed: bool = False) -> Dict[int, List[Task]]:
+        """
+        一次查询获取所有任务并按象限分组
+
+        Args:
+            include_completed: 是否包含已完成的任务
+
+        Returns:
+            {象限: 任务列表}，四个象限都有键，组内保持创建时间倒序
+        """
+        grouped = {q: [] for q in range(4)}
+        for task in self.get_all_tasks(include_completed=include_completed):
+            if task.quadrant in grouped:
+                grouped[task.quadrant].append(task)
+        return grouped
+
     def get_completed_tasks(self) -> List[Task]:
         """
         获取所有已完成的任务
@@ -188,13 +205,6 @@ class TaskManager:
         Raises:
             ValueError: 如果任务不存在或参数无效
         """
-        task = self.get_task(task_id)
-        if not task:
-            raise ValueError(f"任务不存在: {task_id}")
-
-        if task.is_completed:
-            raise ValueError("已完成的任务不能修改")
-
         updates = {}
         if description is not None:
             if not description.strip():
@@ -206,10 +216,12 @@ class TaskManager:
                 raise ValueError("预计番茄钟数不能为负数")
             updates['estimated_pomodoros'] = estimated_pomodoros
 
-        if not updates:
-            return False
+        if updates and self.storage.update_task_if_pending(task_id, **updates):
+            return True
 
-        return self.storage.update_task(task_id, **updates)
+        # 未更新时再区分原因：任务不存在或已完成
+        self._check_pending(task_id, "已完成的任务不能修改")
+        return False
 
     def move_task_to_quadrant(self, task_id: int, new_quadrant: int) -> bool:
         """
@@ -228,17 +240,12 @@ class TaskManager:
         if not 0 <= new_quadrant <= 3:
             raise ValueError(f"无效的象限编号: {new_quadrant}")
 
-        task = self.get_task(task_id)
-        if not task:
-            raise ValueError(f"任务不存在: {task_id}")
-
-        if task.is_completed:
-            raise ValueError("已完成的任务不能移动象限")
+        if self.storage.move_task_to_quadrant(task_id, new_quadrant):
+            return True
 
-        if task.quadrant == new_quadrant:
-            return False  # 已经在目标象限
-
-        return self.storage.update_task(task_id, quadrant=new_quadrant)
+        # 未移动时再区分原因：任务不存在、已完成或已经在目标象限
+        self._check_pending(task_id, "已完成的任务不能移动象限")
+        return False
 
     def complete_task(self, task_id: int) -> bool:
         """
@@ -253,14 +260,13 @@ class TaskManager:
         Raises:
             ValueError: 如果任务不存在
         """
-        task = self.get_task(task_id)
-        if not task:
-            raise ValueError(f"任务不存在: {task_id}")
+        if self.storage.complete_task(task_id):
+            return True
 
-        if task.is_completed:
-            return False  # 已经完成
-
-        return self.storage.complete_task(task_id)
+        # 未更新时再区分原因：任务不存在，或已经完成
+        if self.storage.get_task_completion_state(task_id) is None:
+            raise ValueError(f"任务不存在: {task_id}")
+        return False
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -275,23 +281,41 @@ class TaskManager:
         Raises:
             ValueError: 如果任务不存在
         """
-        task = self.get_task(task_id)
-        if not task:
+        if not self.storage.delete_task(task_id):
+            raise ValueError(f"任务不存在: {task_id}")
+
+        return True
+
+    def _check_pending(self, task_id: int, completed_message: str):
+        """
+        检查任务存在且未完成
+
+        Args:
+            task_id: 任务ID
+            completed_message: 任务已完成时的错误信息
+
+        Raises:
+            ValueError: 如果任务不存在或已完成
+        """
+        is_completed = self.storage.get_task_completion_state(task_id)
+        if is_completed is None:
             raise ValueError(f"任务不存在: {task_id}")
 
-        return self.storage.delete_task(task_id)
+        if is_completed:
+            raise ValueError(completed_message)
 
-    def increment_task_pomodoros(self, task_id: int) -> bool:
+    def increment_task_pomodoros(self, task_id: int, count: int = 1) -> bool:
         """
         增加任务的番茄钟计数
 
         Args:
             task_id: 任务ID
+            count: 增加的数量
 
         Returns:
             是否成功
         """
-        return self.storage.increment_task_pomodoros(task_id)
+        return self.storage.increment_task_pomodoros(task_id, count)
 
     def get_task_duration_days(self, task_id: int) -> Optional[int]:
         """
@@ -303,7 +327,7 @@ class TaskManager:
         Returns:
             持续天数，未完成则返回None
         """
-        task = self.get_task(task_id)
+        task = self.get_task(task_id, cache=True)
         if not task or not task.is_completed:
             return None
 
@@ -324,16 +348,14 @@ class TaskManager:
                 }
             }
         """
-        summary = {}
-        for q in range(4):
-            pending = self.get_tasks_by_quadrant(q, include_completed=False)
-            completed_list = self.get_tasks_by_quadrant(q, include_completed=True)
-            completed = [t for t in completed_list if t.is_completed]
+        counts = self.storage.get_quadrant_counts()
 
+        summary = {}
+        for q, (pending, completed) in counts.items():
             summary[q] = {
-                'pending': len(pending),
-                'completed': len(completed),
-                'total': len(pending) + len(completed)
+                'pending': pending,
+                'completed': completed,
+                'total': pending + completed
             }
 
         return summary
@@ -341,9 +363,13 @@ class TaskManager:
     @staticmethod
     def get_quadrant_name(quadrant: int) -> str:
         """获取象限名称"""
-        return TaskManager.QUADRANT_NAMES.get(quadrant, "未知")
+        if 0 <= quadrant <= 3:
+            return TaskManager.QUADRANT_NAMES[quadrant]
+        return "未知"
 
     @staticmethod
     def get_quadrant_color(quadrant: int) -> str:
         """获取象限颜色"""
-        return TaskManager.QUADRANT_COLORS.get(quadrant, "#808080")
+        if 0 <= quadrant <= 3:
+            return TaskManager.QUADRANT_COLORS[quadrant]
+        return "#808080"
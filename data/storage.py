@@ -3,10 +3,117 @@
 import sqlite3
 import json
 import threading
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from enum import Enum
 
+try:
+    import orjson  # 可选依赖：安装后导出数据时使用更快的序列化
+except ImportError:
+    orjson = None
+
+
+# 高频写入语句：固定为单行常量，保证命中连接的预编译语句缓存
+SQL_INCREMENT_TASK_POMODOROS = "UPDATE tasks SET actual_pomodoros = actual_pomodoros + ? WHERE id = ?"
+SQL_INSERT_SESSION = "INSERT INTO pomodoro_sessions (task_id, start_time, date, status) VALUES (?, ?, ?, ?)"
+SQL_END_SESSION = "UPDATE pomodoro_sessions SET end_time = ?, status = ? WHERE id = ?"
+SQL_INSERT_LOG = "INSERT INTO logs (content, timestamp, task_id, date) VALUES (?, ?, ?, ?)"
+SQL_INSERT_TASK = "INSERT INTO tasks (description, created_date, quadrant, estimated_pomodoros) VALUES (?, ?, ?, ?)"
+
+# SQLite 3.35 起支持 INSERT ... RETURNING，可在同一条语句中取回新插入的行
+SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# 数据库结构：所有表和索引在同一个事务中创建，要么全部生效要么全部不生效
+SCHEMA_SQL = """
+BEGIN IMMEDIATE;
+
+-- 任务表
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    description TEXT NOT NULL,
+    created_date TEXT NOT NULL,
+    estimated_pomodoros INTEGER DEFAULT 0,
+    quadrant INTEGER NOT NULL,
+    completed_date TEXT,
+    actual_pomodoros INTEGER DEFAULT 0,
+    is_completed BOOLEAN DEFAULT 0
+);
+
+-- 番茄钟会话表
+CREATE TABLE IF NOT EXISTS pomodoro_sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    duration INTEGER DEFAULT 30,
+    status TEXT NOT NULL,
+    date TEXT NOT NULL,
+    FOREIGN KEY (task_id) REFERENCES tasks (id)
+);
+
+-- 日志表
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    task_id INTEGER,
+    date TEXT NOT NULL,
+    FOREIGN KEY (task_id) REFERENCES tasks (id)
+);
+
+-- 每日心得感悟表
+CREATE TABLE IF NOT EXISTS daily_reflections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL UNIQUE,
+    content TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+-- 索引（列顺序与查询的 WHERE + ORDER BY 对应）
+CREATE INDEX IF NOT EXISTS idx_tasks_quadrant_completed
+    ON tasks (quadrant, is_completed, created_date DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed
+    ON tasks (is_completed, completed_date DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_date_status
+    ON pomodoro_sessions (date, status);
+CREATE INDEX IF NOT EXISTS idx_sessions_task_status
+    ON pomodoro_sessions (task_id, status);
+CREATE INDEX IF NOT EXISTS idx_logs_date
+    ON logs (date, timestamp);
+CREATE INDEX IF NOT EXISTS idx_logs_task
+    ON logs (task_id, timestamp);
+
+COMMIT;
+"""
+
+
+def _dump_row(row: sqlite3.Row) -> bytes:
+    """将一行数据序列化为UTF-8编码的JSON（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.dumps(dict(row))
+    return json.dumps(dict(row), ensure_ascii=False).encode('utf-8')
+
+
+def _date_of(timestamp: str) -> str:
+    """
+    取 ISO 8601 时间字符串的日期部分（前10个字符即为 YYYY-MM-DD，无需解析）
+
+    Args:
+        timestamp: ISO 格式时间
+
+    Returns:
+        YYYY-MM-DD 格式日期
+
+    Raises:
+        ValueError: 如果时间不是以 YYYY-MM-DD 开头
+    """
+    if timestamp[4:5] != "-" or timestamp[7:8] != "-":
+        raise ValueError(f"无效的时间格式: {timestamp}")
+    return timestamp[:10]
+
 
 class Quadrant(Enum):
     """任务象限枚举"""
@@ -26,6 +133,9 @@ class TimerStatus(Enum):
 class Storage:
     """SQLite数据存储管理器"""
 
+    # get_task(cache=True) 使用的单行任务缓存容量
+    TASK_CACHE_SIZE = 256
+
     def __init__(self, db_path: str = "pomodoro.db"):
         """
         初始化数据库连接
@@ -35,93 +145,139 @@ class Storage:
         """
         self.db_path = db_path
         self.conn = None
-        self._lock = threading.Lock()  # 线程锁，保护数据库操作
+        self._lock = threading.RLock()  # 线程锁，保护数据库操作（可重入，支持事务内嵌套写入）
+        self._transaction_depth = 0  # 当前事务嵌套深度，大于0时写入不单独提交
+        self.sessions_version = 0  # 番茄钟会话写入版本号，供上层缓存失效判断
+        self.tasks_version = 0  # 任务表写入版本号，供界面判断任务列表是否需要重建
+        self._transaction_owner = None  # 持有当前事务的线程ID
+        self._task_cache: 'OrderedDict[int, sqlite3.Row]' = OrderedDict()  # 任务行LRU缓存
+        self._task_cache_version = 0  # 任务缓存失效计数，防止并发读写回填旧行
+        self._local = threading.local()  # 每个线程独立的只读连接
+        self._read_conns: List[sqlite3.Connection] = []  # 已创建的只读连接，关闭时统一释放
+        self._closed = False  # close() 后读写均不可用
         self._connect()
         self._create_tables()
 
     def _connect(self):
         """建立数据库连接"""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                    cached_statements=256)
         self.conn.row_factory = sqlite3.Row
 
-    def _execute_sql(self, query: tuple, fetch_all: bool = False):
+        # WAL + NORMAL 同步：小事务写入无需每次 fsync，且读写可并发
+        # 注意：不开启 foreign_keys，删除任务时其番茄钟会话和日志仍需保留
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA cache_size=-20000")
+
+    def read_connection(self) -> sqlite3.Connection:
         """
-        线程安全的SQL执行方法
+        获取当前线程的只读连接
 
-        Args:
-            query: (sql, params) 元组
-            fetch_all: 是否获取所有结果
+        WAL 模式下多个读连接可与写连接并发，读操作因此无需持锁。处于本线程
+        开启的 transaction() 中时返回写连接，以便读到尚未提交的写入。
+        返回写连接时调用方需持有锁，一般通过 read_cursor() 读取。
 
         Returns:
-            执行结果
+            数据库连接
+
+        Raises:
+            sqlite3.ProgrammingError: 如果存储已关闭
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+        if self.db_path == ":memory:" or (
+                self._transaction_depth and self._transaction_owner == threading.get_ident()):
+            return self.conn
+
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # 允许跨线程关闭，但每个连接只由创建它的线程使用
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._local.conn = conn
+            with self._lock:
+                self._read_conns.append(conn)
+        return conn
+
+    @contextmanager
+    def read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """
+        获取只读游标
+
+        使用当前线程的只读连接时不加锁；共用写连接时（内存数据库，或处于本线程
+        开启的事务中）在锁内读取，避免与其他线程的写入交错。
+
+        Yields:
+            游标
+        """
+        conn = self.read_connection()
+        if conn is self.conn:
+            with self._lock:
+                yield conn.cursor()
+        else:
+            yield conn.cursor()
+
+    @contextmanager
+    def transaction(self) -> Iterator['Storage']:
+        """
+        在一个事务中执行多次写入，结束时统一提交一次
+
+        事务内各写入方法不再单独提交；发生异常时整体回滚。可嵌套使用，
+        只有最外层结束时才提交。
+
+        Yields:
+            存储对象本身
         """
         with self._lock:
-            cursor = self.conn.cursor()
-            cursor.execute(*query)
+            self._transaction_depth += 1
+            self._transaction_owner = threading.get_ident()
+            try:
+                yield self
+            except BaseException:
+                if self._transaction_depth == 1:
+                    self.conn.rollback()
+                    self._invalidate_task_cache()
+                raise
+            else:
+                if self._transaction_depth == 1:
+                    self.conn.commit()
+            finally:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self._transaction_owner = None
+
+    def _commit(self):
+        """提交写入（处于 transaction() 中时推迟到事务结束）"""
+        if self._transaction_depth == 0:
             self.conn.commit()
 
-            if fetch_all:
-                return [dict(row) for row in cursor.fetchall()]
+    def _invalidate_task_cache(self, task_id: Optional[int] = None):
+        """
+        使任务缓存失效
+
+        Args:
+            task_id: 任务ID，None表示清空全部缓存
+        """
+        with self._lock:
+            self._task_cache_version += 1
+            self.tasks_version += 1
+            if task_id is None:
+                self._task_cache.clear()
             else:
-                row = cursor.fetchone()
-                return dict(row) if row else None
+                self._task_cache.pop(task_id, None)
 
     def _create_tables(self):
-        """创建数据库表"""
-        cursor = self.conn.cursor()
-
-        # 任务表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                description TEXT NOT NULL,
-                created_date TEXT NOT NULL,
-                estimated_pomodoros INTEGER DEFAULT 0,
-                quadrant INTEGER NOT NULL,
-                completed_date TEXT,
-                actual_pomodoros INTEGER DEFAULT 0,
-                is_completed BOOLEAN DEFAULT 0
-            )
-        """)
-
-        # 番茄钟会话表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS pomodoro_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id INTEGER,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                duration INTEGER DEFAULT 30,
-                status TEXT NOT NULL,
-                date TEXT NOT NULL,
-                FOREIGN KEY (task_id) REFERENCES tasks (id)
-            )
-        """)
-
-        # 日志表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                content TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                task_id INTEGER,
-                date TEXT NOT NULL,
-                FOREIGN KEY (task_id) REFERENCES tasks (id)
-            )
-        """)
-
-        # 每日心得感悟表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS daily_reflections (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL UNIQUE,
-                content TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
-
-        self.conn.commit()
+        """创建数据库表和索引（单个脚本、单个事务内完成）"""
+        self.conn.executescript(SCHEMA_SQL)
 
     # ==================== 任务操作 ====================
 
@@ -142,33 +298,79 @@ class Storage:
             cursor = self.conn.cursor()
             created_date = datetime.now().isoformat()
 
-            cursor.execute("""
-                INSERT INTO tasks (description, created_date, quadrant, estimated_pomodoros)
-                VALUES (?, ?, ?, ?)
-            """, (description, created_date, quadrant, estimated_pomodoros))
+            cursor.execute(SQL_INSERT_TASK,
+                           (description, created_date, quadrant, estimated_pomodoros))
 
-            self.conn.commit()
+            self._commit()
+            self.tasks_version += 1
             return cursor.lastrowid
 
-    def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+    def create_task_row(self, description: str, quadrant: int,
+                        estimated_pomodoros: int = 0) -> sqlite3.Row:
+        """
+        创建新任务并返回新插入的任务行
+
+        SQLite 支持 RETURNING 时一条语句完成插入和读取，否则退回插入后再查询。
+
+        Args:
+            description: 任务描述
+            quadrant: 所属象限 (0-3)
+            estimated_pomodoros: 预计番茄钟数
+
+        Returns:
+            新任务行
+        """
+        if not SQLITE_SUPPORTS_RETURNING:
+            return self.get_task(self.create_task(description, quadrant, estimated_pomodoros))
+
+        with self._lock:  # 线程安全保护
+            cursor = self.conn.cursor()
+            created_date = datetime.now().isoformat()
+
+            cursor.execute(SQL_INSERT_TASK + " RETURNING *",
+                           (description, created_date, quadrant, estimated_pomodoros))
+            # 先取回行再提交，RETURNING 语句执行完毕后才能提交
+            row = cursor.fetchone()
+
+            self._commit()
+            self.tasks_version += 1
+            return row
+
+    def get_task(self, task_id: int, cache: bool = False) -> Optional[sqlite3.Row]:
         """
         获取单个任务
 
         Args:
             task_id: 任务ID
+            cache: 是否优先读取进程内缓存。经本对象写入的修改会使缓存失效，
+                绕过本对象直接修改数据库的场景应保持默认的False
 
         Returns:
-            任务字典，不存在则返回None
+            任务行，不存在则返回None
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
-        row = cursor.fetchone()
+        with self._lock:
+            if cache:
+                row = self._task_cache.get(task_id)
+                if row is not None:
+                    self._task_cache.move_to_end(task_id)
+                    return row
+            version = self._task_cache_version
 
-        if row:
-            return dict(row)
-        return None
+        with self.read_cursor() as cursor:
+            cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
+            row = cursor.fetchone()
+
+        with self._lock:
+            # 查询期间有写入时不回填，避免缓存旧行
+            if row is not None and version == self._task_cache_version:
+                self._task_cache[task_id] = row
+                self._task_cache.move_to_end(task_id)
+                if len(self._task_cache) > self.TASK_CACHE_SIZE:
+                    self._task_cache.popitem(last=False)
 
-    def get_all_tasks(self, include_completed: bool = False) -> List[Dict[str, Any]]:
+        return row
+
+    def get_all_tasks(self, include_completed: bool = False) -> List[sqlite3.Row]:
         """
         获取所有任务
 
@@ -178,17 +380,16 @@ class Storage:
         Returns:
             任务列表
         """
-        cursor = self.conn.cursor()
-
-        if include_completed:
-            cursor.execute("SELECT * FROM tasks ORDER BY created_date DESC")
-        else:
-            cursor.execute("SELECT * FROM tasks WHERE is_completed = 0 ORDER BY created_date DESC")
+        with self.read_cursor() as cursor:
+            if include_completed:
+                cursor.execute("SELECT * FROM tasks ORDER BY created_date DESC")
+            else:
+                cursor.execute("SELECT * FROM tasks WHERE is_completed = 0 ORDER BY created_date DESC")
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     def get_tasks_by_quadrant(self, quadrant: int,
-                              include_completed: bool = False) -> List[Dict[str, Any]]:
+                              include_completed: bool = False) -> List[sqlite3.Row]:
         """
         获取指定象限的任务
 
@@ -199,31 +400,51 @@ class Storage:
         Returns:
             任务列表
         """
-        cursor = self.conn.cursor()
-
-        if include_completed:
-            cursor.execute(
-                "SELECT * FROM tasks WHERE quadrant = ? ORDER BY created_date DESC",
-                (quadrant,)
-            )
-        else:
-            cursor.execute(
-                "SELECT * FROM tasks WHERE quadrant = ? AND is_completed = 0 ORDER BY created_date DESC",
-                (quadrant,)
-            )
+        with self.read_cursor() as cursor:
+            if include_completed:
+                cursor.execute(
+                    "SELECT * FROM tasks WHERE quadrant = ? ORDER BY created_date DESC",
+                    (quadrant,)
+                )
+            else:
+                cursor.execute(
+                    "SELECT * FROM tasks WHERE quadrant = ? AND is_completed = 0 ORDER BY created_date DESC",
+                    (quadrant,)
+                )
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
-    def get_completed_tasks(self) -> List[Dict[str, Any]]:
+    def get_completed_tasks(self) -> List[sqlite3.Row]:
         """
         获取所有已完成的任务
 
         Returns:
             已完成任务列表
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE is_completed = 1 ORDER BY completed_date DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        with self.read_cursor() as cursor:
+            cursor.execute("SELECT * FROM tasks WHERE is_completed = 1 ORDER BY completed_date DESC")
+            return cursor.fetchall()
+
+    def get_tasks_completed_on(self, date: str) -> List[sqlite3.Row]:
+        """
+        获取在指定日期完成的任务
+
+        Args:
+            date: 日期 (YYYY-MM-DD)
+
+        Returns:
+            任务列表
+        """
+        # 以次日为上界做纯范围扫描，可走 (is_completed, completed_date) 索引
+        next_day = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM tasks
+                WHERE is_completed = 1 AND completed_date >= ? AND completed_date < ?
+                ORDER BY created_date DESC
+            """, (date, next_day))
+            return cursor.fetchall()
 
     def update_task(self, task_id: int, **kwargs) -> bool:
         """
@@ -233,23 +454,91 @@ class Storage:
             task_id: 任务ID
             **kwargs: 要更新的字段
 
+        Returns:
+            是否成功
+        """
+        return self._update_task_fields(task_id, kwargs, "")
+
+    def update_task_if_pending(self, task_id: int, **kwargs) -> bool:
+        """
+        仅当任务未完成时更新任务信息
+
+        Args:
+            task_id: 任务ID
+            **kwargs: 要更新的字段
+
+        Returns:
+            是否更新成功（任务不存在或已完成时返回False）
+        """
+        return self._update_task_fields(task_id, kwargs, " AND is_completed = 0")
+
+    def move_task_to_quadrant(self, task_id: int, quadrant: int) -> bool:
+        """
+        移动未完成的任务到其他象限
+
+        Args:
+            task_id: 任务ID
+            quadrant: 目标象限编号 (0-3)
+
+        Returns:
+            是否移动成功（任务不存在、已完成或已在目标象限时返回False）
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                UPDATE tasks SET quadrant = ?
+                WHERE id = ? AND is_completed = 0 AND quadrant != ?
+            """, (quadrant, task_id, quadrant))
+            self._invalidate_task_cache(task_id)
+            self._commit()
+
+            return cursor.rowcount > 0
+
+    def get_task_completion_state(self, task_id: int) -> Optional[bool]:
+        """
+        获取任务是否已完成（只读取完成标志的轻量查询）
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            是否已完成，任务不存在则返回None
+        """
+        with self.read_cursor() as cursor:
+            cursor.execute("SELECT is_completed FROM tasks WHERE id = ?", (task_id,))
+            row = cursor.fetchone()
+        return bool(row['is_completed']) if row else None
+
+    def _update_task_fields(self, task_id: int, fields: Dict[str, Any],
+                            condition: str) -> bool:
+        """
+        更新任务的允许字段
+
+        Args:
+            task_id: 任务ID
+            fields: 要更新的字段
+            condition: 附加的 WHERE 条件（以 AND 开头，可为空）
+
         Returns:
             是否成功
         """
         allowed_fields = {'description', 'estimated_pomodoros', 'quadrant'}
-        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        updates = {k: v for k, v in fields.items() if k in allowed_fields}
 
         if not updates:
             return False
 
-        query = "UPDATE tasks SET " + ", ".join(f"{k} = ?" for k in updates.keys()) + " WHERE id = ?"
+        query = ("UPDATE tasks SET " + ", ".join(f"{k} = ?" for k in updates.keys())
+                 + " WHERE id = ?" + condition)
         values = list(updates.values()) + [task_id]
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, values)
-        self.conn.commit()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(query, values)
+            self._invalidate_task_cache(task_id)
+            self._commit()
 
-        return cursor.rowcount > 0
+            return cursor.rowcount > 0
 
     def complete_task(self, task_id: int) -> bool:
         """
@@ -259,19 +548,21 @@ class Storage:
             task_id: 任务ID
 
         Returns:
-            是否成功
+            是否成功（任务不存在或已完成时返回False）
         """
-        cursor = self.conn.cursor()
-        completed_date = datetime.now().isoformat()
+        with self._lock:
+            cursor = self.conn.cursor()
+            completed_date = datetime.now().isoformat()
 
-        cursor.execute("""
-            UPDATE tasks
-            SET is_completed = 1, completed_date = ?
-            WHERE id = ?
-        """, (completed_date, task_id))
+            cursor.execute("""
+                UPDATE tasks
+                SET is_completed = 1, completed_date = ?
+                WHERE id = ? AND is_completed = 0
+            """, (completed_date, task_id))
+            self._invalidate_task_cache(task_id)
 
-        self.conn.commit()
-        return cursor.rowcount > 0
+            self._commit()
+            return cursor.rowcount > 0
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -283,29 +574,29 @@ class Storage:
         Returns:
             是否成功
         """
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.conn.commit()
-        return cursor.rowcount > 0
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            self._invalidate_task_cache(task_id)
+            self._commit()
+            return cursor.rowcount > 0
 
-    def increment_task_pomodoros(self, task_id: int) -> bool:
+    def increment_task_pomodoros(self, task_id: int, count: int = 1) -> bool:
         """
         增加任务的番茄钟计数
 
         Args:
             task_id: 任务ID
+            count: 增加的数量（多个番茄钟可一次写入）
 
         Returns:
             是否成功
         """
         with self._lock:  # 线程安全保护
             cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE tasks
-                SET actual_pomodoros = actual_pomodoros + 1
-                WHERE id = ?
-            """, (task_id,))
-            self.conn.commit()
+            cursor.execute(SQL_INCREMENT_TASK_POMODOROS, (count, task_id))
+            self._invalidate_task_cache(task_id)
+            self._commit()
             return cursor.rowcount > 0
 
     # ==================== 番茄钟会话操作 ====================
@@ -317,21 +608,23 @@ class Storage:
 
         Args:
             task_id: 关联任务ID（可为空）
-            start_time: 开始时间
+            start_time: 开始时间（ISO 格式）
 
         Returns:
             会话ID
+
+        Raises:
+            ValueError: 如果开始时间格式无效
         """
+        date = _date_of(start_time)
+
         with self._lock:  # 线程安全保护
             cursor = self.conn.cursor()
-            date = datetime.fromisoformat(start_time).strftime("%Y-%m-%d")
 
-            cursor.execute("""
-                INSERT INTO pomodoro_sessions (task_id, start_time, date, status)
-                VALUES (?, ?, ?, ?)
-            """, (task_id, start_time, date, "running"))
+            cursor.execute(SQL_INSERT_SESSION, (task_id, start_time, date, "running"))
 
-            self.conn.commit()
+            self._commit()
+            self.sessions_version += 1
             return cursor.lastrowid
 
     def end_pomodoro_session(self, session_id: int, end_time: str,
@@ -350,15 +643,41 @@ class Storage:
         with self._lock:  # 线程安全保护
             cursor = self.conn.cursor()
 
-            cursor.execute("""
-                UPDATE pomodoro_sessions
-                SET end_time = ?, status = ?
-                WHERE id = ?
-            """, (end_time, status.value, session_id))
+            cursor.execute(SQL_END_SESSION, (end_time, status.value, session_id))
 
-            self.conn.commit()
+            self._commit()
+            self.sessions_version += 1
             return cursor.rowcount > 0
 
+    def finalize_pomodoro(self, session_id: int, task_id: Optional[int],
+                          status: TimerStatus) -> bool:
+        """
+        结束番茄钟会话，并在未废弃时增加任务的番茄钟计数
+
+        两条更新共用一次加锁、一个结束时间，并在同一事务中提交。
+
+        Args:
+            session_id: 会话ID
+            task_id: 关联任务ID（可为空）
+            status: 结束状态
+
+        Returns:
+            会话是否更新成功
+        """
+        end_time = datetime.now().isoformat()
+
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute(SQL_END_SESSION, (end_time, status.value, session_id))
+            ended = cursor.rowcount > 0
+            self.sessions_version += 1
+
+            if task_id and status != TimerStatus.ABANDONED:
+                cursor.execute(SQL_INCREMENT_TASK_POMODOROS, (1, task_id))
+                self._invalidate_task_cache(task_id)
+
+        return ended
+
     def get_pomodoro_session(self, session_id: int) -> Optional[Dict[str, Any]]:
         """
         获取指定番茄钟会话
@@ -369,16 +688,16 @@ class Storage:
         Returns:
             会话信息字典，不存在则返回None
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM pomodoro_sessions
-            WHERE id = ?
-        """, (session_id,))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM pomodoro_sessions
+                WHERE id = ?
+            """, (session_id,))
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
         return dict(row) if row else None
 
-    def get_pomodoro_sessions_by_date(self, date: str) -> List[Dict[str, Any]]:
+    def get_pomodoro_sessions_by_date(self, date: str) -> List[sqlite3.Row]:
         """
         获取指定日期的番茄钟会话
 
@@ -388,14 +707,14 @@ class Storage:
         Returns:
             会话列表
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM pomodoro_sessions
-            WHERE date = ? AND status = ?
-            ORDER BY start_time
-        """, (date, TimerStatus.COMPLETED.value))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM pomodoro_sessions
+                WHERE date = ? AND status = ?
+                ORDER BY start_time
+            """, (date, TimerStatus.COMPLETED.value))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     def get_daily_pomodoro_count(self, date: str) -> int:
         """
@@ -407,13 +726,61 @@ class Storage:
         Returns:
             番茄钟数量
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM pomodoro_sessions
-            WHERE date = ? AND status = ?
-        """, (date, TimerStatus.COMPLETED.value))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT COUNT(*) as count FROM pomodoro_sessions
+                WHERE date = ? AND status = ?
+            """, (date, TimerStatus.COMPLETED.value))
+
+            row = cursor.fetchone()
+        return row['count'] if row else 0
+
+    def get_pomodoro_counts_in_range(self, start_date: str,
+                                     end_date: str) -> Dict[str, int]:
+        """
+        获取日期范围内每天的番茄钟数量
 
-        row = cursor.fetchone()
+        Args:
+            start_date: 开始日期 (YYYY-MM-DD)，包含
+            end_date: 结束日期 (YYYY-MM-DD)，包含
+
+        Returns:
+            {日期(YYYY-MM-DD): 番茄钟数量}，无数据的日期不出现
+        """
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT date, COUNT(*) as count FROM pomodoro_sessions
+                WHERE date BETWEEN ? AND ? AND status = ?
+                GROUP BY date
+            """, (start_date, end_date, TimerStatus.COMPLETED.value))
+
+            return {row['date']: row['count'] for row in cursor.fetchall()}
+
+    def get_total_pomodoro_count(self, start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None) -> int:
+        """
+        获取日期范围内已完成的番茄钟总数
+
+        Args:
+            start_date: 开始日期 (YYYY-MM-DD)，包含，None表示不限
+            end_date: 结束日期 (YYYY-MM-DD)，包含，None表示不限
+
+        Returns:
+            番茄钟数量
+        """
+        query = "SELECT COUNT(*) as count FROM pomodoro_sessions WHERE status = ?"
+        params: List[Any] = [TimerStatus.COMPLETED.value]
+
+        if start_date:
+            query += " AND date >= ?"
+            params.append(start_date)
+        if end_date:
+            query += " AND date <= ?"
+            params.append(end_date)
+
+        with self.read_cursor() as cursor:
+            cursor.execute(query, params)
+            row = cursor.fetchone()
         return row['count'] if row else 0
 
     def get_pomodoro_sessions_by_task(self, task_id: int) -> List[Dict[str, Any]]:
@@ -426,14 +793,14 @@ class Storage:
         Returns:
             会话列表
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM pomodoro_sessions
-            WHERE task_id = ? AND status = ?
-            ORDER BY start_time
-        """, (task_id, TimerStatus.COMPLETED.value))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM pomodoro_sessions
+                WHERE task_id = ? AND status = ?
+                ORDER BY start_time
+            """, (task_id, TimerStatus.COMPLETED.value))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_task_pomodoro_count(self, task_id: int) -> int:
         """
@@ -445,13 +812,13 @@ class Storage:
         Returns:
             番茄钟数量
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM pomodoro_sessions
-            WHERE task_id = ? AND status = ?
-        """, (task_id, TimerStatus.COMPLETED.value))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT COUNT(*) as count FROM pomodoro_sessions
+                WHERE task_id = ? AND status = ?
+            """, (task_id, TimerStatus.COMPLETED.value))
 
-        row = cursor.fetchone()
+            row = cursor.fetchone()
         return row['count'] if row else 0
 
     # ==================== 日志操作 ====================
@@ -470,14 +837,11 @@ class Storage:
         with self._lock:  # 线程安全保护
             cursor = self.conn.cursor()
             timestamp = datetime.now().isoformat()
-            date = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d")
+            date = _date_of(timestamp)
 
-            cursor.execute("""
-                INSERT INTO logs (content, timestamp, task_id, date)
-                VALUES (?, ?, ?, ?)
-            """, (content, timestamp, task_id, date))
+            cursor.execute(SQL_INSERT_LOG, (content, timestamp, task_id, date))
 
-            self.conn.commit()
+            self._commit()
             return cursor.lastrowid
 
     def get_logs_by_date(self, date: str) -> List[Dict[str, Any]]:
@@ -490,16 +854,16 @@ class Storage:
         Returns:
             日志列表
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM logs
-            WHERE date = ?
-            ORDER BY timestamp
-        """, (date,))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM logs
+                WHERE date = ?
+                ORDER BY timestamp
+            """, (date,))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
 
-    def get_logs_by_task(self, task_id: int) -> List[Dict[str, Any]]:
+    def get_logs_by_task(self, task_id: int) -> List[sqlite3.Row]:
         """
         获取指定任务的日志
 
@@ -509,14 +873,14 @@ class Storage:
         Returns:
             日志列表
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM logs
-            WHERE task_id = ?
-            ORDER BY timestamp
-        """, (task_id,))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM logs
+                WHERE task_id = ?
+                ORDER BY timestamp
+            """, (task_id,))
 
-        return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     # ==================== 每日心得感悟操作 ====================
 
@@ -535,25 +899,15 @@ class Storage:
             cursor = self.conn.cursor()
             now = datetime.now().isoformat()
 
-            # 检查是否已存在
-            cursor.execute("SELECT id FROM daily_reflections WHERE date = ?", (date,))
-            exists = cursor.fetchone()
-
-            if exists:
-                # 更新
-                cursor.execute("""
-                    UPDATE daily_reflections
-                    SET content = ?, updated_at = ?
-                    WHERE date = ?
-                """, (content, now, date))
-            else:
-                # 插入
-                cursor.execute("""
-                    INSERT INTO daily_reflections (date, content, created_at, updated_at)
-                    VALUES (?, ?, ?, ?)
-                """, (date, content, now, now))
+            # 不存在则插入，已存在则更新（date 唯一）
+            cursor.execute("""
+                INSERT INTO daily_reflections (date, content, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE
+                SET content = excluded.content, updated_at = excluded.updated_at
+            """, (date, content, now, now))
 
-            self.conn.commit()
+            self._commit()
             return True
 
     def get_daily_reflection(self, date: str) -> Optional[Dict[str, Any]]:
@@ -566,9 +920,9 @@ class Storage:
         Returns:
             感悟字典，不存在则返回None
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM daily_reflections WHERE date = ?", (date,))
-        row = cursor.fetchone()
+        with self.read_cursor() as cursor:
+            cursor.execute("SELECT * FROM daily_reflections WHERE date = ?", (date,))
+            row = cursor.fetchone()
 
         if row:
             return dict(row)
@@ -581,9 +935,9 @@ class Storage:
         Returns:
             感悟列表，按日期降序
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM daily_reflections ORDER BY date DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        with self.read_cursor() as cursor:
+            cursor.execute("SELECT * FROM daily_reflections ORDER BY date DESC")
+            return [dict(row) for row in cursor.fetchall()]
 
     # ==================== 统计操作 ====================
 
@@ -597,31 +951,52 @@ class Storage:
         Returns:
             {象限: 任务数量}
         """
-        cursor = self.conn.cursor()
+        with self.read_cursor() as cursor:
+            if date is None:
+                # 当前状态
+                cursor.execute("""
+                    SELECT quadrant, COUNT(*) as count
+                    FROM tasks
+                    WHERE is_completed = 0
+                    GROUP BY quadrant
+                """)
+            else:
+                # 历史快照：获取在指定日期之前创建且在指定日期时仍未完成的任务
+                # 这里简化处理，返回历史数据
+                cursor.execute("""
+                    SELECT quadrant, COUNT(*) as count
+                    FROM tasks
+                    WHERE is_completed = 0
+                      AND created_date <= ?
+                      AND (completed_date IS NULL OR completed_date > ?)
+                    GROUP BY quadrant
+                """, (date + "T23:59:59", date + "T00:00:00"))
+
+            result = {0: 0, 1: 0, 2: 0, 3: 0}
+            for row in cursor.fetchall():
+                result[row['quadrant']] = row['count']
 
-        if date is None:
-            # 当前状态
+        return result
+
+    def get_quadrant_counts(self) -> Dict[int, Tuple[int, int]]:
+        """
+        获取各象限未完成与已完成任务数量
+
+        Returns:
+            {象限: (未完成数量, 已完成数量)}
+        """
+        with self.read_cursor() as cursor:
             cursor.execute("""
-                SELECT quadrant, COUNT(*) as count
+                SELECT quadrant,
+                       SUM(CASE WHEN is_completed THEN 0 ELSE 1 END) as pending,
+                       SUM(CASE WHEN is_completed THEN 1 ELSE 0 END) as completed
                 FROM tasks
-                WHERE is_completed = 0
                 GROUP BY quadrant
             """)
-        else:
-            # 历史快照：获取在指定日期之前创建且在指定日期时仍未完成的任务
-            # 这里简化处理，返回历史数据
-            cursor.execute("""
-                SELECT quadrant, COUNT(*) as count
-                FROM tasks
-                WHERE is_completed = 0
-                  AND created_date <= ?
-                  AND (completed_date IS NULL OR completed_date > ?)
-                GROUP BY quadrant
-            """, (date + "T23:59:59", date + "T00:00:00"))
 
-        result = {0: 0, 1: 0, 2: 0, 3: 0}
-        for row in cursor.fetchall():
-            result[row['quadrant']] = row['count']
+            result = {0: (0, 0), 1: (0, 0), 2: (0, 0), 3: (0, 0)}
+            for row in cursor.fetchall():
+                result[row['quadrant']] = (row['pending'], row['completed'])
 
         return result
 
@@ -636,18 +1011,22 @@ class Storage:
         Returns:
             {日期(DD): 番茄钟数量}
         """
-        cursor = self.conn.cursor()
-        month_str = f"{year}-{month:02d}"
+        # 以下月1日为上界做纯范围扫描，可直接走 (date, status) 索引
+        start = f"{year}-{month:02d}-01"
+        if month == 12:
+            end = f"{year + 1}-01-01"
+        else:
+            end = f"{year}-{month + 1:02d}-01"
 
-        cursor.execute("""
-            SELECT substr(date, 9) as day, COUNT(*) as count
-            FROM pomodoro_sessions
-            WHERE date LIKE ? AND status = ?
-            GROUP BY date
-            ORDER BY date
-        """, (f"{month_str}%", TimerStatus.COMPLETED.value))
+        with self.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT date, COUNT(*) as count
+                FROM pomodoro_sessions
+                WHERE date >= ? AND date < ? AND status = ?
+                GROUP BY date
+            """, (start, end, TimerStatus.COMPLETED.value))
 
-        return {row['day']: row['count'] for row in cursor.fetchall()}
+            return {row['date'][8:10]: row['count'] for row in cursor.fetchall()}
 
     def export_to_json(self, file_path: str) -> bool:
         """
@@ -659,22 +1038,33 @@ class Storage:
         Returns:
             是否成功
         """
-        try:
-            data = {
-                'tasks': self.get_all_tasks(include_completed=True),
-                'pomodoro_sessions': [],
-                'logs': []
-            }
+        # 逐行写出，避免先把所有表读入内存
+        sections = (
+            ('tasks', "SELECT * FROM tasks ORDER BY created_date DESC"),
+            ('pomodoro_sessions', "SELECT * FROM pomodoro_sessions ORDER BY start_time"),
+            ('logs', "SELECT * FROM logs ORDER BY timestamp"),
+        )
 
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM pomodoro_sessions ORDER BY start_time")
-            data['pomodoro_sessions'] = [dict(row) for row in cursor.fetchall()]
-
-            cursor.execute("SELECT * FROM logs ORDER BY timestamp")
-            data['logs'] = [dict(row) for row in cursor.fetchall()]
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        try:
+            with open(file_path, 'wb') as f:
+                f.write(b'{')
+                for i, (key, query) in enumerate(sections):
+                    if i > 0:
+                        f.write(b',')
+                    f.write(f'\n  "{key}": ['.encode('utf-8'))
+
+                    with self.read_cursor() as cursor:
+                        cursor.arraysize = 1000
+                        cursor.execute(query)
+
+                        separator = b'\n    '
+                        for row in cursor:
+                            f.write(separator)
+                            f.write(_dump_row(row))
+                            separator = b',\n    '
+
+                    f.write(b'\n  ]')
+                f.write(b'\n}\n')
 
             return True
         except Exception as e:
@@ -682,6 +1072,12 @@ class Storage:
             return False
 
     def close(self):
-        """关闭数据库连接"""
+        """关闭数据库连接（之后的读写都会抛出 sqlite3.ProgrammingError）"""
+        with self._lock:
+            self._closed = True
+            for conn in self._read_conns:
+                conn.close()
+            self._read_conns.clear()
+
         if self.conn:
             self.conn.close()
@@ -0,0 +1,222 @@
+"""任务对话框基类 - 创建/编辑对话框共用的界面结构"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QLineEdit, QSpinBox, QFrame
+)
+from gui.styles import (
+    Fonts, Spacing,
+    install_app_stylesheet, repolish
+)
+
+
+class BaseTaskDialog(QDialog):
+    """任务对话框基类：卡片、标题、任务名称、番茄钟数和按钮栏"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        install_app_stylesheet()
+        self.setObjectName("taskDialog")
+
+        self.task_name_input = None
+        self.pomodoro_input = None
+        self.error_label = None
+
+    def _build_card(self) -> QVBoxLayout:
+        """
+        创建内容卡片
+
+        Returns:
+            卡片内容区的布局
+        """
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+
+        content_card = QFrame()
+        content_card.setObjectName("dialogCard")
+
+        content_layout = QVBoxLayout(content_card)
+        content_layout.setContentsMargins(Spacing.XXL, Spacing.XXL, Spacing.XXL, Spacing.XXL)
+        content_layout.setSpacing(Spacing.XL)
+
+        main_layout.addWidget(content_card)
+        return content_layout
+
+    def _build_title(self, layout: QVBoxLayout, title: str, subtitle: str):
+        """
+        创建标题区和分割线
+
+        Args:
+            layout: 卡片内容区布局
+            title: 标题
+            subtitle: 副标题
+        """
+        title_section = QVBoxLayout()
+        title_section.setSpacing(Spacing.SM)
+
+        title_label = QLabel(title)
+        title_label.setFont(Fonts.title(18))
+        title_label.setObjectName("dialogTitle")
+        title_section.addWidget(title_label)
+
+        subtitle_label = QLabel(subtitle)
+        subtitle_label.setFont(Fonts.caption())
+        subtitle_label.setObjectName("dialogSubtitle")
+        title_section.addWidget(subtitle_label)
+
+        layout.addLayout(title_section)
+
+        # 分割线
+        line = QFrame()
+        line.setFixedHeight(1)
+        line.setObjectName("dialogDivider")
+        layout.addWidget(line)
+
+    def _build_field_label(self, layout: QVBoxLayout, text: str) -> QLabel:
+        """创建输入项标签"""
+        label = QLabel(text)
+        label.setFont(Fonts.body())
+        label.setObjectName("fieldLabel")
+        layout.addWidget(label)
+        return label
+
+    def _build_name_input(self, layout: QVBoxLayout, placeholder: str) -> QLineEdit:
+        """
+        创建任务名称输入框
+
+        Args:
+            layout: 输入区布局
+            placeholder: 占位提示文字
+
+        Returns:
+            任务名称输入框
+        """
+        self._build_field_label(layout, "任务名称")
+
+        self.task_name_input = QLineEdit()
+        self.task_name_input.setPlaceholderText(placeholder)
+        self.task_name_input.setMinimumHeight(44)
+        self.task_name_input.setObjectName("taskNameInput")
+        self.task_name_input.textEdited.connect(self._clear_error)
+        layout.addWidget(self.task_name_input)
+
+        # 输入错误提示（验证失败时显示在输入框下方）
+        self.error_label = QLabel()
+        self.error_label.setFont(Fonts.caption())
+        self.error_label.setObjectName("fieldError")
+        self.error_label.hide()
+        layout.addWidget(self.error_label)
+        return self.task_name_input
+
+    def _build_pomodoro_input(self, layout: QVBoxLayout) -> QSpinBox:
+        """
+        创建预计番茄钟输入框
+
+        Args:
+            layout: 输入区布局
+
+        Returns:
+            番茄钟数输入框
+        """
+        self._build_field_label(layout, "预计番茄钟")
+
+        pomodoro_input_layout = QHBoxLayout()
+        pomodoro_input_layout.setSpacing(Spacing.SM)
+
+        self.pomodoro_input = QSpinBox()
+        self.pomodoro_input.setRange(0, 99)
+        self.pomodoro_input.setValue(1)
+        self.pomodoro_input.setMinimumHeight(44)
+        self.pomodoro_input.setObjectName("pomodoroInput")
+        pomodoro_input_layout.addWidget(self.pomodoro_input)
+
+        pomodoro_unit = QLabel("个")
+        pomodoro_unit.setFont(Fonts.body())
+        pomodoro_unit.setObjectName("fieldUnit")
+        pomodoro_input_layout.addWidget(pomodoro_unit)
+
+        pomodoro_input_layout.addStretch()
+
+        layout.addLayout(pomodoro_input_layout)
+        return self.pomodoro_input
+
+    @staticmethod
+    def _init_button(button: QPushButton, variant: str = ""):
+        """设置按钮的 objectName 和样式变体，外观由全局样式表决定"""
+        button.setObjectName("dialogButton")
+        button.setProperty("variant", variant)
+        button.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    def _build_button_bar(self, layout: QVBoxLayout, left_text: str, right_text: str):
+        """
+        创建底部按钮栏（左侧取消，右侧确认）
+
+        Args:
+            layout: 卡片内容区布局
+            left_text: 取消按钮文字
+            right_text: 确认按钮文字
+
+        Returns:
+            (取消按钮, 确认按钮)
+        """
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(Spacing.MD)
+
+        cancel_btn = QPushButton(left_text)
+        cancel_btn.setFixedHeight(44)
+        cancel_btn.setMinimumWidth(120)
+        self._init_button(cancel_btn)
+        cancel_btn.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_btn)
+
+        button_layout.addStretch()
+
+        confirm_btn = QPushButton(right_text)
+        confirm_btn.setFixedHeight(44)
+        confirm_btn.setMinimumWidth(140)
+        self._init_button(confirm_btn, "primary")
+        confirm_btn.clicked.connect(self.accept)
+        button_layout.addWidget(confirm_btn)
+
+        layout.addLayout(button_layout)
+        return cancel_btn, confirm_btn
+
+    def _reset_inputs(self):
+        """对话框复用时清除上次的错误样式并恢复焦点"""
+        self._clear_error()
+        self.task_name_input.setFocus()
+
+    def _clear_error(self):
+        """清除输入错误提示"""
+        if not self.error_label.isHidden():
+            self.error_label.hide()
+        self._apply_error_style(self.task_name_input, False)
+
+    def _apply_error_style(self, widget, error: bool = True):
+        """切换输入框的错误样式（由全局样式表的 error 属性匹配）"""
+        if widget.property("error") != error:
+            widget.setProperty("error", error)
+            repolish(widget)
+
+    def validate(self):
+        """验证输入"""
+        description = self.task_name_input.text().strip()
+
+        if not description:
+            self._apply_error_style(self.task_name_input)
+            return False, "任务名称不能为空"
+
+        return True, ""
+
+    def accept(self):
+        """确认前验证输入，无效时在对话框内提示并保持打开"""
+        valid, error_msg = self.validate()
+        if not valid:
+            self.error_label.setText(error_msg)
+            self.error_label.show()
+            self.task_name_input.setFocus()
+            return
+
+        super().accept()
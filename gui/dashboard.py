@@ -2,43 +2,80 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QGridLayout, QGraphicsDropShadowEffect
+    QFrame, QGridLayout
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, QRect
+from PyQt6.QtGui import QColor, QPainter
 from core.statistics import DailyStatistics
 from gui.styles import (
-    Colors, Fonts, Spacing
+    Colors, Fonts, Spacing, install_app_stylesheet, repolish
 )
 
 
-# 卡片样式（带阴影）
-def get_card_style(bg_color: str, has_data: bool = False) -> str:
-    """获取卡片样式"""
-    border_color = Colors.PRIMARY if has_data else Colors.BORDER
-    return f"""
-        QFrame {{
-            background-color: {bg_color};
-            border-radius: 12px;
-            border: 1px solid {border_color};
-        }}
-    """
+# 卡片数值状态（对应全局样式表中 QLabel#statValue 的 state 属性）
+VALUE_STATE_EMPTY = ""
+VALUE_STATE_PRIMARY = "primary"
+VALUE_STATE_SUCCESS = "success"
+VALUE_STATE_WARNING = "warning"
 
 
-# 进度条样式
-PROGRESS_BAR_BG_STYLE = """
-    QFrame {
-        background-color: """ + Colors.BG_HOVER + """;
-        border-radius: 4px;
-    }
-"""
+# 专注时长鼓励语：(分钟下限, 文案)，按下限从高到低排列
+FOCUS_TIME_SUBTITLES = (
+    (240, "专注力爆表！"),        # 4小时以上
+    (180, "非常高效的一天！"),    # 3小时以上
+    (120, "表现不错，继续保持"),  # 2小时以上
+    (60, "好的开始"),             # 1小时以上
+)
+
+# 完成率文案：(完成率上限（不含）, 文案)，按上限从低到高排列
+COMPLETION_RATE_SUBTITLES = (
+    (25, "好的开始，继续保持！"),
+    (50, "稳步推进中"),
+    (75, "表现不错"),
+    (100, "即将完成！"),
+)
 
-PROGRESS_BAR_FILL_STYLE = """
-    QFrame {
-        background-color: """ + Colors.PRIMARY + """;
-        border-radius: 4px;
-    }
-"""
+
+class ProgressBar(QWidget):
+    """自绘进度条：单个控件直接绘制背景和填充，更新时只需重绘"""
+
+    BAR_HEIGHT = 8
+    RADIUS = 4
+
+    _BG_COLOR = QColor(Colors.BG_HOVER)
+    _FILL_COLOR = QColor(Colors.PRIMARY)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rate = 0.0
+        self.setFixedHeight(self.BAR_HEIGHT)
+
+    def set_rate(self, rate: float):
+        """
+        设置完成率
+
+        Args:
+            rate: 完成率 (0-100)
+        """
+        if rate != self._rate:
+            self._rate = rate
+            self.update()
+
+    def paintEvent(self, event):
+        """绘制背景和按完成率计算宽度的填充"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        rect = self.rect()
+        painter.setBrush(self._BG_COLOR)
+        painter.drawRoundedRect(rect, self.RADIUS, self.RADIUS)
+
+        fill_width = int(rect.width() * min(self._rate, 100) / 100)
+        if fill_width > 0:
+            painter.setBrush(self._FILL_COLOR)
+            painter.drawRoundedRect(QRect(0, 0, fill_width, rect.height()),
+                                    self.RADIUS, self.RADIUS)
 
 
 class StatCard(QFrame):
@@ -52,15 +89,22 @@ class StatCard(QFrame):
         self.value_label = None
         self.subtitle_label = None
         self.has_data = False  # 是否有数据
-
+        self._last_has_data = None  # 上次应用到样式的 hasData 属性
+        self._last_font_size = -1  # 上次应用的字号
+        self._last_size = None  # 上次计算字号时的卡片尺寸 (宽, 高)
+        self._last_value = None  # 上次显示的数值
+        self._last_subtitle = None  # 上次显示的副标题
+        self._value_state = None  # 数值标签当前的 state 属性
+
+        install_app_stylesheet()
         self.init_ui()
-        self.add_shadow()
 
     def init_ui(self):
         """初始化UI"""
-        self.setLayout(QVBoxLayout())
-        self.layout().setContentsMargins(Spacing.LG, Spacing.LG, Spacing.LG, Spacing.LG)
-        self.layout().setSpacing(Spacing.SM)
+        self.setObjectName("statCard")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(Spacing.LG, Spacing.LG, Spacing.LG, Spacing.LG)
+        layout.setSpacing(Spacing.SM)
 
         # 最小高度（避免太小）
         self.setMinimumHeight(100)
@@ -80,44 +124,47 @@ class StatCard(QFrame):
         title_layout.addWidget(title_label)
 
         title_layout.addStretch()
-        self.layout().addLayout(title_layout)
+        layout.addLayout(title_layout)
 
         # 核心数值（自适应大小）
         self.value_label = QLabel("0")
+        self.value_label.setObjectName("statValue")
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.value_label.setWordWrap(True)
-        self.layout().addWidget(self.value_label)
+        layout.addWidget(self.value_label)
 
         # 副标题（状态说明）
         self.subtitle_label = QLabel("")
         self.subtitle_label.setFont(Fonts.caption())
         self.subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle_label.setWordWrap(True)
-        self.layout().addWidget(self.subtitle_label)
+        layout.addWidget(self.subtitle_label)
 
-        self.layout().addStretch()
+        layout.addStretch()
 
         # 初始样式（无数据状态）
         self.update_style()
 
-    def add_shadow(self):
-        """添加卡片阴影"""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(8)
-        shadow.setOffset(0, 2)
-        shadow.setColor(QColor(0, 0, 0, 10))
-        self.setGraphicsEffect(shadow)
-
     def update_style(self):
-        """更新卡片样式（根据是否有数据）"""
-        bg_color = Colors.BG_CARD if not self.has_data else "#F0F9FF"
-        self.setStyleSheet(get_card_style(bg_color, self.has_data))
+        """更新卡片样式（切换 hasData 属性，颜色由全局样式表决定）"""
+        has_data = bool(self.has_data)
+        if has_data == self._last_has_data:
+            return
+        self._last_has_data = has_data
+        self.setProperty("hasData", has_data)
+        repolish(self)
 
     def update_font_size(self):
         """根据卡片宽度和高度动态调整字体大小"""
         if self.value_label:
-            card_width = self.width() if self.width() > 0 else 150
-            card_height = self.height() if self.height() > 0 else 100
+            # 尺寸未变化时字号必然相同，直接跳过
+            size = (self.width(), self.height())
+            if size == self._last_size:
+                return
+            self._last_size = size
+
+            card_width = size[0] if size[0] > 0 else 150
+            card_height = size[1] if size[1] > 0 else 100
 
             # 计算可用空间（考虑padding和间距）
             available_width = card_width - 32  # 减去左右padding
@@ -150,12 +197,21 @@ class StatCard(QFrame):
 
             # 应用字体大小（确保不小于最小值）
             final_size = max(min_size, int(font_size))
+            if final_size == self._last_font_size:
+                return
+
+            # Fonts 按字号缓存，所有卡片共享同一字体对象
             self.value_label.setFont(Fonts.timer_display(final_size))
+            self._last_font_size = final_size
 
     def resizeEvent(self, event):
-        """窗口大小改变时更新字体大小"""
+        """窗口大小改变时更新字体大小（在仪表盘中时合并到仪表盘的延迟更新）"""
         super().resizeEvent(event)
-        self.update_font_size()
+        parent = self.parentWidget()
+        if isinstance(parent, TodayDashboard):
+            parent.schedule_layout_update()
+        else:
+            self.update_font_size()
 
     def set_data(self, value: str, subtitle: str = "", has_data: bool = None):
         """
@@ -166,18 +222,32 @@ class StatCard(QFrame):
             subtitle: 副标题/状态说明
             has_data: 是否有数据（决定颜色主题）
         """
-        self.value_label.setText(value)
-        self.subtitle_label.setText(subtitle)
+        # 只更新发生变化的部分，未变化时不触碰控件
+        if value != self._last_value:
+            self._last_value = value
+            self.value_label.setText(value)
+        if subtitle != self._last_subtitle:
+            self._last_subtitle = subtitle
+            self.subtitle_label.setText(subtitle)
 
         if has_data is not None:
-            self.has_data = has_data
-            self.update_style()
+            if has_data != self.has_data:
+                self.has_data = has_data
+                self.update_style()
 
             # 根据状态调整颜色
-            if self.has_data:
-                self.value_label.setStyleSheet(f"color: {Colors.PRIMARY}; font-weight: bold;")
-            else:
-                self.value_label.setStyleSheet(f"color: {Colors.TEXT_TERTIARY};")
+            self._set_value_state(self.value_state())
+
+    def value_state(self) -> str:
+        """数值标签的状态（子类可按数据细分颜色）"""
+        return VALUE_STATE_PRIMARY if self.has_data else VALUE_STATE_EMPTY
+
+    def _set_value_state(self, state: str):
+        """切换数值标签的 state 属性，颜色由全局样式表决定，状态未变化时跳过"""
+        if state != self._value_state:
+            self._value_state = state
+            self.value_label.setProperty("state", state)
+            repolish(self.value_label)
 
 
 class PomodoroCard(StatCard):
@@ -210,28 +280,24 @@ class FocusTimeCard(StatCard):
         """更新数据"""
         if minutes == 0:
             self.set_data("0m", "开始你的专注之旅", False)
-        else:
-            hours = minutes // 60
-            mins = minutes % 60
+            return
 
-            if hours > 0:
-                time_str = f"{hours}h {mins}m" if mins > 0 else f"{hours}h"
-                subtitle = f"累计专注 {hours} 小时" if mins == 0 else f"专注 {hours} 小时 {mins} 分钟"
-            else:
-                time_str = f"{mins}m"
-                subtitle = "专注进行中..."
+        hours, mins = divmod(minutes, 60)
+        if hours == 0:
+            time_str = "%dm" % mins
+        elif mins:
+            time_str = "%dh %dm" % (hours, mins)
+        else:
+            time_str = "%dh" % hours
 
-            # 根据时长给出不同的鼓励
-            if minutes >= 240:  # 4小时以上
-                subtitle = "专注力爆表！"
-            elif minutes >= 180:  # 3小时以上
-                subtitle = "非常高效的一天！"
-            elif minutes >= 120:  # 2小时以上
-                subtitle = "表现不错，继续保持"
-            elif minutes >= 60:  # 1小时以上
-                subtitle = "好的开始"
+        # 根据时长给出不同的鼓励，不足1小时时显示进行中
+        subtitle = "专注进行中..."
+        for threshold, text in FOCUS_TIME_SUBTITLES:
+            if minutes >= threshold:
+                subtitle = text
+                break
 
-            self.set_data(time_str, subtitle, True)
+        self.set_data(time_str, subtitle, True)
 
 
 class CompletedTasksCard(StatCard):
@@ -267,39 +333,49 @@ class CompletionRateCard(StatCard):
 
         if rate == 0:
             self.set_data("0%", "还没开始，来一个番茄？", False)
-        elif rate < 25:
-            self.set_data(f"{rate:.0f}%", "好的开始，继续保持！", True)
-        elif rate < 50:
-            self.set_data(f"{rate:.0f}%", "稳步推进中", True)
-        elif rate < 75:
-            self.set_data(f"{rate:.0f}%", "表现不错", True)
-        elif rate < 100:
-            self.set_data(f"{rate:.0f}%", "即将完成！", True)
         else:
-            self.set_data("100%", "完美收官！", True)
+            for limit, text in COMPLETION_RATE_SUBTITLES:
+                if rate < limit:
+                    self.set_data("%.0f%%" % rate, text, True)
+                    break
+            else:
+                self.set_data("100%", "完美收官！", True)
 
-        # 根据完成率调整颜色
-        if rate >= 80:
-            self.value_label.setStyleSheet(f"color: {Colors.SUCCESS}; font-weight: bold;")
-        elif rate >= 50:
-            self.value_label.setStyleSheet(f"color: {Colors.PRIMARY}; font-weight: bold;")
-        elif rate > 0:
-            self.value_label.setStyleSheet(f"color: {Colors.WARNING}; font-weight: bold;")
+    def value_state(self) -> str:
+        """根据完成率调整颜色"""
+        if self.rate >= 80:
+            return VALUE_STATE_SUCCESS
+        elif self.rate >= 50:
+            return VALUE_STATE_PRIMARY
+        elif self.rate > 0:
+            return VALUE_STATE_WARNING
+        return VALUE_STATE_EMPTY
 
 
 class TodayDashboard(QFrame):
     """今日概况仪表盘 - 完全响应式设计"""
 
+    # 尺寸变化后延迟重算布局的时间（毫秒），拖动窗口时合并连续的 resize 事件
+    LAYOUT_UPDATE_DELAY_MS = 50
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.cards = []  # 保存所有卡片引用
+        self._last_stats_key = None  # 上次显示的数据 (番茄钟数, 已完成数, 未完成数)
+
+        self._layout_timer = QTimer(self)
+        self._layout_timer.setSingleShot(True)
+        self._layout_timer.timeout.connect(self._apply_layout_update)
+
         self.init_ui()
 
     def init_ui(self):
         """初始化UI"""
         # 主容器样式
+        # 只匹配容器本身，避免覆盖卡片的全局样式
+        self.setObjectName("todayDashboard")
         self.setStyleSheet(f"""
-            QFrame {{
+            QFrame#todayDashboard {{
                 background-color: {Colors.BG_CARD};
                 border-radius: {Spacing.RADIUS_CARD}px;
                 border: 1px solid {Colors.BORDER};
@@ -372,17 +448,9 @@ class TodayDashboard(QFrame):
 
         progress_layout.addLayout(progress_header)
 
-        # 进度条背景
-        self.progress_bar_bg = QFrame()
-        self.progress_bar_bg.setFixedHeight(8)
-        self.progress_bar_bg.setStyleSheet(PROGRESS_BAR_BG_STYLE)
-
-        # 进度条填充
-        self.progress_bar_fill = QFrame(self.progress_bar_bg)
-        self.progress_bar_fill.setGeometry(0, 0, 0, 8)
-        self.progress_bar_fill.setStyleSheet(PROGRESS_BAR_FILL_STYLE)
-
-        progress_layout.addWidget(self.progress_bar_bg)
+        # 进度条（按宽度自绘，尺寸变化时自动重绘）
+        self.progress_bar = ProgressBar()
+        progress_layout.addWidget(self.progress_bar)
 
         main_layout.addWidget(progress_container)
 
@@ -391,51 +459,61 @@ class TodayDashboard(QFrame):
 
     def update_dashboard(self, stats: DailyStatistics):
         """更新仪表盘数据"""
-        # 1. 更新番茄钟数
-        self.pomodoro_card.update_data(stats.total_pomodoros)
-
-        # 2. 更新专注时长
-        focus_minutes = stats.total_pomodoros * 30
-        self.focus_time_card.update_data(focus_minutes)
-
-        # 3. 更新完成任务数
-        self.completed_card.update_data(len(stats.completed_tasks))
-
-        # 4. 更新完成率
-        total_tasks = sum(stats.pending_counts.values()) + len(stats.completed_tasks)
-        if total_tasks > 0:
-            completion_rate = (len(stats.completed_tasks) / total_tasks) * 100
-        else:
-            completion_rate = 0
+        completed_count = len(stats.completed_tasks)
+        pending_count = sum(stats.pending_counts.values())
+
+        # 数据未变化时无需重新设置任何控件
+        stats_key = (stats.total_pomodoros, completed_count, pending_count)
+        if stats_key == self._last_stats_key:
+            return
+        self._last_stats_key = stats_key
+
+        # 暂停重绘，所有卡片更新完成后统一重绘一次
+        self.setUpdatesEnabled(False)
+        try:
+            # 1. 更新番茄钟数
+            self.pomodoro_card.update_data(stats.total_pomodoros)
+
+            # 2. 更新专注时长
+            focus_minutes = stats.total_pomodoros * 30
+            self.focus_time_card.update_data(focus_minutes)
+
+            # 3. 更新完成任务数
+            self.completed_card.update_data(completed_count)
+
+            # 4. 更新完成率
+            total_tasks = pending_count + completed_count
+            if total_tasks > 0:
+                completion_rate = (completed_count / total_tasks) * 100
+            else:
+                completion_rate = 0
 
-        self.rate_card.update_data(completion_rate)
+            self.rate_card.update_data(completion_rate)
 
-        # 5. 更新进度条
-        self.progress_value_label.setText(f"{completion_rate:.0f}%")
+            # 5. 更新进度条
+            self.progress_value_label.setText(f"{completion_rate:.0f}%")
+            self.progress_bar.set_rate(completion_rate)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
-        # 延迟更新进度条宽度（确保组件已渲染）
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, lambda: self._update_progress_bar(completion_rate))
         # 同时更新卡片字体大小
-        QTimer.singleShot(0, self._update_cards_font_size)
-
-    def _update_progress_bar(self, rate: float):
-        """更新进度条（内部方法）"""
-        if self.progress_bar_bg.width() > 0:
-            fill_width = int(self.progress_bar_bg.width() * rate / 100)
-            self.progress_bar_fill.setFixedWidth(fill_width)
+        self.schedule_layout_update()
 
     def _update_cards_font_size(self):
         """更新所有卡片的字体大小"""
         for card in self.cards:
             card.update_font_size()
 
+    def schedule_layout_update(self):
+        """安排一次延迟的布局更新，期间的多次调用只执行一次"""
+        self._layout_timer.start(self.LAYOUT_UPDATE_DELAY_MS)
+
+    def _apply_layout_update(self):
+        """重新计算卡片字体大小"""
+        self._update_cards_font_size()
+
     def resizeEvent(self, event):
         """窗口大小改变时更新所有子元素"""
         super().resizeEvent(event)
-        # 重新计算进度条宽度
-        if hasattr(self, 'rate_card'):
-            self._update_progress_bar(self.rate_card.rate)
-        # 更新所有卡片字体大小
-        if hasattr(self, 'cards'):
-            self._update_cards_font_size()
+        self.schedule_layout_update()
@@ -2,46 +2,180 @@
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QFrame, QListWidget, QListWidgetItem, QPushButton, QDialog
+    QFrame, QListView, QStyledItemDelegate, QPushButton, QDialog,
+    QMessageBox, QMenu, QTabWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
-from typing import Optional
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QAbstractListModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QColor, QBrush, QFont, QFontMetrics
+from datetime import datetime
+from functools import partial
+from typing import List, Optional
 from core.task_manager import TaskManager, Task
-from core.pomodoro_timer import PomodoroTimer
-from gui.styles import Colors, Fonts, Spacing
+from core.pomodoro_timer import PomodoroTimerBase
+from gui.styles import Colors, Fonts, Spacing, install_app_stylesheet
 from gui.create_task_dialog import CreateTaskDialog
 from gui.edit_task_dialog import EditTaskDialog
 
 
+class TaskListModel(QAbstractListModel):
+    """象限任务列表模型：视图只为可见行取数据，刷新时按行增删改"""
+
+    _HIGHLIGHT_BRUSH = QBrush(QColor(Colors.BG_SELECTED))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks: List[Task] = []
+        self._texts: List[str] = []  # 与 _tasks 一一对应的显示文本
+        self._running_task_id: Optional[int] = None  # 正在计时的任务（高亮）
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._texts[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._tasks[row].id
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # 当前任务高亮
+            if self._tasks[row].id == self._running_task_id:
+                return self._HIGHLIGHT_BRUSH
+            return None
+        return None
+
+    def set_tasks(self, tasks: List[Task], running_task_id: Optional[int] = None):
+        """
+        更新任务列表，只通知视图发生变化的行
+
+        Args:
+            tasks: 新的任务列表（按显示顺序）
+            running_task_id: 正在计时的任务ID（高亮显示）
+        """
+        new_ids = {task.id for task in tasks}
+
+        # 1. 移除已不在列表中的任务（从后往前，行号不受影响）
+        for row in range(len(self._tasks) - 1, -1, -1):
+            if self._tasks[row].id not in new_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._tasks[row]
+                del self._texts[row]
+                self.endRemoveRows()
+
+        # 保留下来的任务顺序发生变化时整体重置
+        old_ids = [task.id for task in self._tasks]
+        old_id_set = set(old_ids)
+        if [task.id for task in tasks if task.id in old_id_set] != old_ids:
+            self.beginResetModel()
+            self._tasks = list(tasks)
+            self._texts = [self._format_task_text(task) for task in tasks]
+            self._running_task_id = running_task_id
+            self.endResetModel()
+            return
+
+        # 2. 插入新任务，更新内容或高亮状态变化的任务
+        highlight_ids = set()
+        if running_task_id != self._running_task_id:
+            highlight_ids = {self._running_task_id, running_task_id}
+            self._running_task_id = running_task_id
+
+        for row, task in enumerate(tasks):
+            if row == len(self._tasks) or self._tasks[row].id != task.id:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._tasks.insert(row, task)
+                self._texts.insert(row, self._format_task_text(task))
+                self.endInsertRows()
+                continue
+
+            changed = task.id in highlight_ids
+            if self._task_sig(task) != self._task_sig(self._tasks[row]):
+                self._texts[row] = self._format_task_text(task)
+                changed = True
+            self._tasks[row] = task
+
+            if changed:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    @staticmethod
+    def _task_sig(task: Task) -> tuple:
+        """影响显示文本的字段"""
+        return (task.description, task.actual_pomodoros, task.estimated_pomodoros,
+                task.created_date)
+
+    @staticmethod
+    def _format_task_text(task: Task) -> str:
+        """构建任务的显示文本 - 包含详细信息"""
+        # 解析创建时间
+        try:
+            created_date = datetime.fromisoformat(task.created_date)
+            created_str = created_date.strftime("%m-%d %H:%M")
+        except:
+            created_str = "未知时间"
+
+        display_text = f"{task.description}\n"
+        display_text += f"  📅 创建时间: {created_str}\n"
+        display_text += f"  🍅 已用番茄钟: {task.actual_pomodoros} / 预计: {task.estimated_pomodoros}"
+        return display_text
+
+
+class TaskRowDelegate(QStyledItemDelegate):
+    """任务行代理：所有行高度相同，按字体缓存行尺寸"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._size: Optional[QSize] = None
+        self._font: Optional[QFont] = None  # 计算 _size 时使用的字体
+
+    def sizeHint(self, option, index) -> QSize:
+        """行尺寸（5行文本，确保番茄钟信息完整显示），字体变化时重新计算"""
+        if self._size is None or option.font != self._font:
+            self._font = QFont(option.font)
+            line_height = QFontMetrics(self._font).lineSpacing()
+            self._size = QSize(500, line_height * 5 + 15)
+        return self._size
+
+
 class OptimizedQuadrantCard(QFrame):
     """优化的象限卡片"""
 
     task_selected = pyqtSignal(int)
-    task_updated = pyqtSignal()
+    task_updated = pyqtSignal(int)  # 受影响的象限
+    task_moved = pyqtSignal(int, int)  # (原象限, 目标象限)
+
+    # 刷新请求的合并窗口（毫秒），连续的多次刷新只执行一次
+    REFRESH_DELAY_MS = 50
 
     def __init__(self, quadrant: int, task_manager: TaskManager,
-                 timer: PomodoroTimer, parent=None):
+                 timer: PomodoroTimerBase, parent=None):
         super().__init__(parent)
+        install_app_stylesheet()
         self.quadrant = quadrant
         self.task_manager = task_manager
         self.timer = timer
 
-        self.quadrant_name = TaskManager.get_quadrant_name(quadrant)
-        self.quadrant_color = self._get_quadrant_color(quadrant)
+        self.quadrant_name = TaskManager.QUADRANT_NAMES[quadrant]
+
+        # 对话框首次使用时创建，之后复用
+        self._create_dialog = None
+        self._edit_dialog = None
+
+        # 任务列表模型，刷新时只增删改发生变化的行
+        self._model = TaskListModel(self)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._dirty = False  # 隐藏期间有未执行的刷新，显示时补上
 
         self.init_ui()
-        self.refresh()
-
-    def _get_quadrant_color(self, quadrant: int) -> str:
-        """获取象限颜色"""
-        colors = {
-            0: Colors.QUADRANT_0,
-            1: Colors.QUADRANT_1,
-            2: Colors.QUADRANT_2,
-            3: Colors.QUADRANT_3
-        }
-        return colors.get(quadrant, Colors.TEXT_TERTIARY)
+        self._do_refresh()
 
     def init_ui(self):
         """初始化UI"""
@@ -51,13 +185,7 @@ class OptimizedQuadrantCard(QFrame):
 
         # 卡片容器
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_CARD};
-                border-radius: {Spacing.RADIUS_CARD}px;
-                border: 1px solid {Colors.BORDER};
-            }}
-        """)
+        card.setObjectName("quadrantCard")
 
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(Spacing.LG, Spacing.LG, Spacing.LG, Spacing.LG)
@@ -71,13 +199,14 @@ class OptimizedQuadrantCard(QFrame):
         color_bar = QLabel()
         color_bar.setFixedWidth(4)
         color_bar.setFixedHeight(20)
-        color_bar.setStyleSheet(f"background-color: {self.quadrant_color}; border-radius: 2px;")
+        color_bar.setObjectName("quadrantColorBar")
+        color_bar.setProperty("quadrant", self.quadrant)
         title_bar.addWidget(color_bar)
 
         # 标题
         title_label = QLabel(self.quadrant_name)
         title_label.setFont(Fonts.title())
-        title_label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY};")
+        title_label.setObjectName("quadrantTitle")
         title_bar.addWidget(title_label)
 
         title_bar.addStretch()
@@ -85,148 +214,101 @@ class OptimizedQuadrantCard(QFrame):
         # 任务数量
         self.count_label = QLabel("0")
         self.count_label.setFont(Fonts.caption())
-        self.count_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        self.count_label.setObjectName("quadrantCount")
         title_bar.addWidget(self.count_label)
 
         card_layout.addLayout(title_bar)
 
         # 任务列表
-        self.task_list = QListWidget()
+        self.task_list = QListView()
+        self.task_list.setModel(self._model)
+        self.task_list.setItemDelegate(TaskRowDelegate(self.task_list))
+        self.task_list.setUniformItemSizes(True)
+        # 分批布局：大量任务时先布局首批行，其余在事件循环中分批完成
+        self.task_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.task_list.setBatchSize(50)
         self.task_list.setMinimumHeight(180)
         self.task_list.setAlternatingRowColors(True)
         self.task_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.task_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.task_list.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.task_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }}
-
-            QListWidget::item {{
-                border-radius: {Spacing.RADIUS_SMALL}px;
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                margin-bottom: {Spacing.XS}px;
-                color: {Colors.TEXT_PRIMARY};
-            }}
-
-            QListWidget::item:hover {{
-                background-color: {Colors.BG_HOVER};
-            }}
-
-            QListWidget::item:selected {{
-                background-color: {Colors.BG_SELECTED};
-                color: {Colors.PRIMARY};
-            }}
-        """)
+        self.task_list.doubleClicked.connect(self.on_item_double_clicked)
+        self.task_list.setObjectName("quadrantTaskList")
         card_layout.addWidget(self.task_list)
 
+        self._build_context_menu()
+
         # 添加按钮（使用产品级样式）
         add_btn = QPushButton("+ 创建任务")
         add_btn.setFixedHeight(36)
-        add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {Colors.PRIMARY};
-                border: 1px dashed {Colors.PRIMARY};
-                border-radius: {Spacing.RADIUS_BUTTON}px;
-                font-size: 13px;
-                font-weight: 600;
-            }}
-
-            QPushButton:hover {{
-                background-color: {Colors.BG_SELECTED};
-                border-color: {Colors.PRIMARY_HOVER};
-            }}
-        """)
+        add_btn.setObjectName("quadrantAddBtn")
         add_btn.clicked.connect(self.create_task)
         card_layout.addWidget(add_btn)
 
         main_layout.addWidget(card)
 
     def refresh(self):
-        """刷新任务列表"""
-        self.task_list.clear()
-
-        tasks = self.task_manager.get_tasks_by_quadrant(
-            self.quadrant,
-            include_completed=False
-        )
-
-        for task in tasks:
-            # 解析创建时间
-            from datetime import datetime
-            from PyQt6.QtGui import QFontMetrics, QFont
-            from PyQt6.QtCore import QSize
-            try:
-                created_date = datetime.fromisoformat(task.created_date)
-                created_str = created_date.strftime("%m-%d %H:%M")
-            except:
-                created_str = "未知时间"
-
-            # 构建显示文本 - 包含详细信息
-            display_text = f"{task.description}\n"
-            display_text += f"  📅 创建时间: {created_str}\n"
-            display_text += f"  🍅 已用番茄钟: {task.actual_pomodoros} / 预计: {task.estimated_pomodoros}"
-
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, task.id)
-
-            # 设置项目大小以适应多行文本（增加到4行以确保完整显示）
-            font = self.task_list.font()
-            fm = QFontMetrics(font)
-            line_height = fm.lineSpacing()
-            # 增加高度到5行，确保番茄钟信息完整显示
-            item.setSizeHint(QSize(500, line_height * 5 + 15))
-
-            # 当前任务高亮
-            if self.timer.current_task_id == task.id and self.timer.is_running:
-                item.setBackground(QBrush(QColor(Colors.BG_SELECTED)))
-
-            self.task_list.addItem(item)
+        """安排一次延迟刷新，合并窗口内的多次调用只执行一次；卡片不可见时推迟到显示时"""
+        if not self.isVisible():
+            self._dirty = True
+            return
+        self._refresh_timer.start()
+
+    def showEvent(self, event):
+        """显示时补上隐藏期间推迟的刷新"""
+        if self._dirty:
+            self._do_refresh()
+        super().showEvent(event)
+
+    def _do_refresh(self, tasks: Optional[List[Task]] = None):
+        """
+        刷新任务列表（模型只通知发生变化的行）
+
+        Args:
+            tasks: 已查询好的本象限任务，None 时自行查询
+        """
+        self._refresh_timer.stop()
+        self._dirty = False
+
+        if tasks is None:
+            tasks = self.task_manager.get_tasks_by_quadrant(
+                self.quadrant,
+                include_completed=False
+            )
+        running_task_id = self.timer.current_task_id if self.timer.is_running else None
+
+        # 暂停重绘，所有行变化完成后统一布局和重绘一次
+        self.task_list.setUpdatesEnabled(False)
+        try:
+            self._model.set_tasks(tasks, running_task_id)
+        finally:
+            self.task_list.setUpdatesEnabled(True)
 
         # 更新任务数量
         self.count_label.setText(str(len(tasks)))
 
     def create_task(self):
         """创建新任务 - 使用产品级对话框"""
-        dialog = CreateTaskDialog(quadrant=self.quadrant, parent=self)
-
-        # 循环直到用户取消或输入有效
-        while True:
-            result = dialog.exec()
-
-            if result != QDialog.DialogCode.Accepted:
-                # 用户取消
-                return
-
-            # 验证输入
-            valid, error_msg = dialog.validate()
-            if not valid:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "输入验证失败", error_msg)
-                # 重新显示同一个对话框，保留用户输入
-                continue
+        if self._create_dialog is None:
+            self._create_dialog = CreateTaskDialog(quadrant=self.quadrant, parent=self)
+        else:
+            self._create_dialog.reset(self.quadrant)
+        dialog = self._create_dialog
+
+        # 对话框在确认时已验证输入，无效时不会关闭
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
 
-            # 获取数据并创建任务
-            task_data = dialog.get_task_data()
-            try:
-                self.task_manager.create_task(
-                    task_data['description'],
-                    task_data['quadrant'],
-                    task_data['estimated_pomodoros']
-                )
-                # 刷新当前象限
-                self.refresh()
-                # 发送信号通知主窗口刷新所有视图
-                self.task_updated.emit()
-                return
-            except ValueError as e:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "创建失败", str(e))
-                # 出错后退出，避免无限循环
-                return
+        task_data = dialog.get_task_data()
+        try:
+            self.task_manager.create_task(
+                task_data['description'],
+                task_data['quadrant'],
+                task_data['estimated_pomodoros']
+            )
+            # 通知刷新任务所在的象限（可能不是当前象限）和其他视图
+            self.task_updated.emit(task_data['quadrant'])
+        except ValueError as e:
+            QMessageBox.warning(self, "创建失败", str(e))
 
     def edit_task(self, task_id: int):
         """编辑任务 - 使用编辑对话框"""
@@ -234,17 +316,15 @@ class OptimizedQuadrantCard(QFrame):
         if not task:
             return
 
-        dialog = EditTaskDialog(task, parent=self)
+        if self._edit_dialog is None:
+            self._edit_dialog = EditTaskDialog(task, parent=self)
+        else:
+            self._edit_dialog.reset(task)
+        dialog = self._edit_dialog
         result = dialog.exec()
 
+        # 对话框在确认时已验证输入
         if result == QDialog.DialogCode.Accepted:
-            # 验证输入
-            valid, error_msg = dialog.validate()
-            if not valid:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(self, "错误", error_msg)
-                return
-
             # 获取数据并更新任务
             task_data = dialog.get_task_data()
             try:
@@ -253,128 +333,120 @@ class OptimizedQuadrantCard(QFrame):
                     description=task_data['description'],
                     estimated_pomodoros=task_data['estimated_pomodoros']
                 )
-                self.refresh()
-                self.task_updated.emit()
+                self.task_updated.emit(self.quadrant)
             except ValueError as e:
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "错误", str(e))
 
+    def _confirm(self, title: str, text: str, on_confirmed):
+        """
+        显示非阻塞的确认框（不进入嵌套事件循环）
+
+        Args:
+            title: 标题
+            text: 提示文字
+            on_confirmed: 用户选择"是"后调用的函数
+        """
+        box = QMessageBox(
+            QMessageBox.Icon.Question, title, text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def on_button_clicked(button):
+            if box.standardButton(button) == QMessageBox.StandardButton.Yes:
+                on_confirmed()
+
+        box.buttonClicked.connect(on_button_clicked)
+        box.open()
+
     def complete_task(self, task_id: int):
         """完成任务"""
-        from PyQt6.QtWidgets import QMessageBox
-
-        reply = QMessageBox.question(
-            self,
-            "确认完成",
-            "确定要标记此任务为完成吗？",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        self._confirm("确认完成", "确定要标记此任务为完成吗？",
+                      lambda: self._on_complete_confirmed(task_id))
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.task_manager.complete_task(task_id)
-                self.refresh()
-                self.task_updated.emit()
-            except ValueError as e:
-                QMessageBox.warning(self, "错误", str(e))
+    def _on_complete_confirmed(self, task_id: int):
+        """确认后完成任务"""
+        try:
+            self.task_manager.complete_task(task_id)
+            self.task_updated.emit(self.quadrant)
+        except ValueError as e:
+            QMessageBox.warning(self, "错误", str(e))
 
     def delete_task(self, task_id: int):
         """删除任务"""
-        from PyQt6.QtWidgets import QMessageBox
-
-        reply = QMessageBox.question(
-            self,
-            "确认删除",
-            "确定要删除此任务吗？",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        self._confirm("确认删除", "确定要删除此任务吗？",
+                      lambda: self._on_delete_confirmed(task_id))
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                self.task_manager.delete_task(task_id)
-                self.refresh()
-                self.task_updated.emit()
-            except ValueError as e:
-                QMessageBox.warning(self, "错误", str(e))
+    def _on_delete_confirmed(self, task_id: int):
+        """确认后删除任务"""
+        try:
+            self.task_manager.delete_task(task_id)
+            self.task_updated.emit(self.quadrant)
+        except ValueError as e:
+            QMessageBox.warning(self, "错误", str(e))
 
     def move_task_to_quadrant(self, task_id: int, new_quadrant: int):
         """移动任务到其他象限"""
         try:
             self.task_manager.move_task_to_quadrant(task_id, new_quadrant)
-            self.refresh()
-            self.task_updated.emit()
+            self.task_moved.emit(self.quadrant, new_quadrant)
         except ValueError as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "错误", str(e))
 
     def select_task_for_timer(self, task_id: int):
         """选择任务用于番茄钟"""
         self.task_selected.emit(task_id)
 
-    def on_item_double_clicked(self, item: QListWidgetItem):
+    def on_item_double_clicked(self, index: QModelIndex):
         """双击任务项"""
-        task_id = item.data(Qt.ItemDataRole.UserRole)
+        task_id = index.data(Qt.ItemDataRole.UserRole)
         self.select_task_for_timer(task_id)
 
-    def show_context_menu(self, position):
-        """显示右键菜单"""
-        item = self.task_list.itemAt(position)
-        if not item:
-            return
-
-        task_id = item.data(Qt.ItemDataRole.UserRole)
-
-        from PyQt6.QtWidgets import QMenu
+    def _build_context_menu(self):
+        """创建右键菜单（只创建一次，弹出时只更新对应的任务）"""
+        self._ctx_task_id: Optional[int] = None  # 右键菜单对应的任务
 
         menu = QMenu(self)
-        menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {Colors.BG_CARD};
-                border: 1px solid {Colors.BORDER};
-                border-radius: {Spacing.RADIUS_SMALL}px;
-                padding: {Spacing.XS}px;
-            }}
-
-            QMenu::item {{
-                padding: {Spacing.SM}px {Spacing.MD}px;
-                color: {Colors.TEXT_PRIMARY};
-            }}
-
-            QMenu::item:selected {{
-                background-color: {Colors.BG_SELECTED};
-            }}
-        """)
+        menu.setObjectName("quadrantMenu")
 
         select_action = menu.addAction("选择此任务")
-        select_action.triggered.connect(lambda: self.select_task_for_timer(task_id))
+        select_action.triggered.connect(lambda: self.select_task_for_timer(self._ctx_task_id))
 
         menu.addSeparator()
 
         edit_action = menu.addAction("编辑")
-        edit_action.triggered.connect(lambda: self.edit_task(task_id))
+        edit_action.triggered.connect(lambda: self.edit_task(self._ctx_task_id))
 
         move_menu = menu.addMenu("移动到...")
-        move_menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {Colors.BG_CARD};
-                border: 1px solid {Colors.BORDER};
-                border-radius: {Spacing.RADIUS_SMALL}px;
-            }}
-        """)
+        move_menu.setObjectName("quadrantMoveMenu")
         for q in range(4):
             if q != self.quadrant:
-                action = move_menu.addAction(TaskManager.get_quadrant_name(q))
-                action.triggered.connect(lambda checked, q=q: self.move_task_to_quadrant(task_id, q))
+                action = move_menu.addAction(TaskManager.QUADRANT_NAMES[q])
+                action.triggered.connect(partial(self._move_context_task, q))
 
         menu.addSeparator()
 
         complete_action = menu.addAction("标记完成")
-        complete_action.triggered.connect(lambda: self.complete_task(task_id))
+        complete_action.triggered.connect(lambda: self.complete_task(self._ctx_task_id))
 
         delete_action = menu.addAction("删除")
-        delete_action.triggered.connect(lambda: self.delete_task(task_id))
+        delete_action.triggered.connect(lambda: self.delete_task(self._ctx_task_id))
+
+        self._context_menu = menu
 
-        menu.exec(self.task_list.mapToGlobal(position))
+    def _move_context_task(self, new_quadrant: int, checked: bool = False):
+        """把右键菜单对应的任务移动到指定象限（triggered 信号附带的 checked 忽略）"""
+        self.move_task_to_quadrant(self._ctx_task_id, new_quadrant)
+
+    def show_context_menu(self, position):
+        """显示右键菜单"""
+        index = self.task_list.indexAt(position)
+        if not index.isValid():
+            return
+
+        self._ctx_task_id = index.data(Qt.ItemDataRole.UserRole)
+        self._context_menu.exec(self.task_list.mapToGlobal(position))
 
 
 class OptimizedQuadrantsView(QWidget):
@@ -383,13 +455,22 @@ class OptimizedQuadrantsView(QWidget):
     task_updated = pyqtSignal()
     task_selected = pyqtSignal(int)
 
-    def __init__(self, task_manager: TaskManager, timer: PomodoroTimer):
+    # 刷新请求的合并窗口（毫秒），连续的多次刷新只执行一次
+    REFRESH_DELAY_MS = 50
+
+    def __init__(self, task_manager: TaskManager, timer: PomodoroTimerBase):
         super().__init__()
+        install_app_stylesheet()
         self.task_manager = task_manager
         self.timer = timer
 
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # 各象限卡片创建时已加载任务
         self.init_ui()
-        self.refresh()
 
     def init_ui(self):
         """初始化UI"""
@@ -398,53 +479,88 @@ class OptimizedQuadrantsView(QWidget):
         main_layout.setSpacing(Spacing.LG)
 
         # 标签页
-        from PyQt6.QtWidgets import QTabWidget
-
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: none;
-                background-color: transparent;
-            }}
-
-            QTabBar::tab {{
-                background-color: transparent;
-                color: {Colors.TEXT_SECONDARY};
-                padding: {Spacing.MD}px {Spacing.LG}px;
-                margin-right: {Spacing.SM}px;
-                border: none;
-                font-size: 13px;
-                font-weight: 500;
-            }}
-
-            QTabBar::tab:hover {{
-                color: {Colors.TEXT_PRIMARY};
-            }}
-
-            QTabBar::tab:selected {{
-                color: {Colors.PRIMARY};
-            }}
-        """)
-
-        self.quadrant_cards = []
+        self.tab_widget.setObjectName("quadrantTabs")
+
+        # 象限卡片在标签页首次显示时才创建，之前用空白占位
+        self.quadrant_cards: List[Optional[OptimizedQuadrantCard]] = [None] * 4
         for q in range(4):
-            card = OptimizedQuadrantCard(q, self.task_manager, self.timer, self.tab_widget)
-            card.task_selected.connect(self.on_task_selected)
-            card.task_updated.connect(self.on_task_updated_inner)
-            self.tab_widget.addTab(card, TaskManager.get_quadrant_name(q))
-            self.quadrant_cards.append(card)
+            self.tab_widget.addTab(QWidget(), TaskManager.QUADRANT_NAMES[q])
+        self.tab_widget.currentChanged.connect(self._ensure_card)
 
         main_layout.addWidget(self.tab_widget)
 
+        self._ensure_card(self.tab_widget.currentIndex())
+
+    def _ensure_card(self, index: int):
+        """
+        确保指定标签页的象限卡片已创建
+
+        Args:
+            index: 标签页索引（即象限编号）
+        """
+        if index < 0 or self.quadrant_cards[index] is not None:
+            return
+
+        card = OptimizedQuadrantCard(index, self.task_manager, self.timer, self.tab_widget)
+        card.task_selected.connect(self.on_task_selected)
+        card.task_updated.connect(self.on_task_updated_inner)
+        card.task_moved.connect(self.on_task_moved_inner)
+        self.quadrant_cards[index] = card
+
+        # 替换占位页，期间不触发 currentChanged
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, card, TaskManager.QUADRANT_NAMES[index])
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
     def refresh(self):
-        """刷新所有象限的任务"""
+        """安排一次延迟刷新，合并窗口内的多次调用只执行一次"""
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """刷新已创建的象限卡片（多个卡片时一次查询，按象限分发）"""
+        cards = []
         for card in self.quadrant_cards:
-            card.refresh()
+            if card is None:
+                continue
+            if card.isVisible():
+                cards.append(card)
+            else:
+                # 隐藏的卡片显示时再刷新
+                card.refresh()
+        if not cards:
+            return
+        if len(cards) == 1:
+            cards[0]._do_refresh()
+            return
+
+        grouped = self.task_manager.get_tasks_grouped_by_quadrant()
+        for card in cards:
+            card._do_refresh(grouped[card.quadrant])
 
     def on_task_selected(self, task_id: int):
         """处理任务选择信号"""
         self.task_selected.emit(task_id)
 
-    def on_task_updated_inner(self):
-        """处理内部任务更新信号"""
+    def refresh_quadrant(self, quadrant: int):
+        """只刷新指定象限的任务（卡片尚未创建时无需刷新，创建时会加载最新数据）"""
+        card = self.quadrant_cards[quadrant]
+        if card is not None:
+            card.refresh()
+
+    def on_task_updated_inner(self, quadrant: int):
+        """处理内部任务更新信号：只刷新受影响的象限"""
+        self.refresh_quadrant(quadrant)
+        self.task_updated.emit()
+
+    def on_task_moved_inner(self, from_quadrant: int, to_quadrant: int):
+        """处理任务移动信号：刷新原象限和目标象限"""
+        self.refresh_quadrant(from_quadrant)
+        self.refresh_quadrant(to_quadrant)
         self.task_updated.emit()
@@ -5,39 +5,20 @@ from PyQt6.QtWidgets import (
     QPushButton, QComboBox, QFrame, QMessageBox, QSizePolicy
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from typing import Optional
+from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from typing import Dict, Optional
 from datetime import datetime
 from core.task_manager import TaskManager
-from core.pomodoro_timer import PomodoroTimer, TimerState
+from core.pomodoro_timer import PomodoroTimerBase, TimerState
 from core.statistics import Statistics
-from data.storage import Storage, TimerStatus
+from data.storage import TimerStatus
 from utils.logger import Logger
 from gui.styles import (
-    Colors, Fonts, Spacing,
-    apply_primary_button_style, apply_secondary_button_style,
-    apply_combo_box_style
+    Fonts, Spacing,
+    install_app_stylesheet, repolish
 )
 
-# 番茄钟主卡片专用样式（视觉锚点）
-TIMER_CARD_STYLE = f"""
-    QFrame {{
-        background-color: {Colors.BG_TIMER};
-        border-radius: {Spacing.RADIUS_TIMER_CARD}px;
-        border: 1px solid {Colors.BORDER};
-    }}
-"""
-
-# 番茄钟容器阴影效果
-TIMER_SHADOW_STYLE = """
-    QFrame {
-        background-color: transparent;
-    }
-    QFrame > QFrame {
-        background-color: %s;
-        border-radius: %dpx;
-    }
-"""
+TASK_COMBO_MIN_CHARS = 20  # 任务下拉框最小宽度（字符数）
 
 
 class OptimizedTimerPanel(QWidget):
@@ -45,18 +26,35 @@ class OptimizedTimerPanel(QWidget):
 
     log_added = pyqtSignal()
 
-    def __init__(self, timer: PomodoroTimer, task_manager: TaskManager,
+    # 各状态下的控件配置：(开始按钮文字, 开始可用, 暂停可用, 停止可用, 任务下拉框可用)
+    # 开始按钮文字为 None 表示保持不变
+    _STATE_UI_CONFIG = {
+        TimerState.READY: ("开始", True, False, False, True),
+        TimerState.RUNNING: (None, False, True, True, False),
+        TimerState.PAUSED: ("继续", True, False, True, False),
+        TimerState.COMPLETED: (None, False, False, False, True),
+        TimerState.ABANDONED: ("开始", True, False, False, True),
+    }
+
+    def __init__(self, timer: PomodoroTimerBase, task_manager: TaskManager,
                  logger: Logger, parent=None):
         super().__init__(parent)
+        install_app_stylesheet()
         self.timer = timer
         self.task_manager = task_manager
         self.logger = logger
         self.storage = task_manager.storage
-        self.statistics = Statistics(self.storage)
+        self.statistics: Optional[Statistics] = None  # 由主窗口注入共享的统计对象
 
         self.current_session_id: Optional[int] = None
         self.current_session_start_time: Optional[str] = None  # 记录会话开始时间
 
+        self._last_time_text = ""  # 倒计时标签上次显示的文字
+        self._task_list_version: Optional[int] = None  # 下拉框对应的任务数据版本
+        self._task_list_sig = None  # 下拉框条目签名（象限、任务ID、描述）
+        self._task_id_to_index: Dict[int, int] = {}  # 任务ID -> 下拉框行号
+        self._status_state: Optional[TimerState] = None  # 状态标签当前对应的状态
+
         self.init_ui()
         self.connect_signals()
         self.refresh_task_list()
@@ -70,14 +68,8 @@ class OptimizedTimerPanel(QWidget):
 
         # ===== 计时器卡片（视觉锚点）=====
         timer_card = QFrame()
-        # 使用专属淡蓝背景 + 更大圆角 + 轻微阴影
-        timer_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.BG_TIMER};
-                border-radius: {Spacing.RADIUS_TIMER_CARD}px;
-                border: 1px solid {Colors.BORDER};
-            }}
-        """)
+        # 专属淡蓝背景 + 更大圆角，样式由全局样式表按 objectName 匹配
+        timer_card.setObjectName("timerCard")
 
         timer_layout = QVBoxLayout(timer_card)
         timer_layout.setContentsMargins(Spacing.XXXXL, Spacing.XXXXL, Spacing.XXXXL, Spacing.XXXXL)
@@ -86,21 +78,27 @@ class OptimizedTimerPanel(QWidget):
         # 当前任务显示
         self.current_task_label = QLabel("未选择任务")
         self.current_task_label.setFont(Fonts.caption())
-        self.current_task_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        self.current_task_label.setTextFormat(Qt.TextFormat.PlainText)  # 任务名按纯文本显示
+        self.current_task_label.setObjectName("timerTask")
         self.current_task_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         timer_layout.addWidget(self.current_task_label)
 
         # 计时器数字（绝对主视觉）
-        self.time_label = QLabel(self.timer.get_formatted_time())
+        self.time_label = QLabel()
         self.time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        # 每秒更新的纯文本：跳过富文本检测，不处理文本交互
+        self.time_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.time_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
         self.time_label.setFont(Fonts.timer_extra_bold(88))  # 增大10% + 超粗字重
-        self.time_label.setStyleSheet(f"color: {Colors.TIMER_DISPLAY};")  # 深蓝近黑
+        self.time_label.setObjectName("timerDisplay")  # 深蓝近黑
+        self._update_time_label()
         timer_layout.addWidget(self.time_label)
 
         # 状态标签（降级为辅助信息）
         self.status_label = QLabel("就绪")
         self.status_label.setFont(Fonts.body(14))  # 缩小字体
-        self.status_label.setStyleSheet(f"color: {Colors.TIMER_STATUS};")  # 灰蓝色
+        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.status_label.setObjectName("timerStatus")  # 颜色由全局样式表按 state 属性决定
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         timer_layout.addWidget(self.status_label)
 
@@ -112,7 +110,7 @@ class OptimizedTimerPanel(QWidget):
         self.start_btn = QPushButton("开始")
         self.start_btn.setFixedHeight(56)
         self.start_btn.setMinimumWidth(140)
-        apply_primary_button_style(self.start_btn)  # 实心、品牌色 - 主按钮
+        self._init_button(self.start_btn, "primary")  # 实心、品牌色 - 主按钮
         # 使用一个统一的槽函数处理开始/继续
         self.start_btn.clicked.connect(self.on_start_or_resume_clicked)
         button_layout.addWidget(self.start_btn)
@@ -120,7 +118,7 @@ class OptimizedTimerPanel(QWidget):
         self.pause_btn = QPushButton("暂停")
         self.pause_btn.setFixedHeight(56)
         self.pause_btn.setMinimumWidth(120)  # 略窄于开始按钮
-        apply_secondary_button_style(self.pause_btn)  # 描边按钮 - 次级
+        self._init_button(self.pause_btn)  # 描边按钮 - 次级
         self.pause_btn.setEnabled(False)
         self.pause_btn.clicked.connect(self.pause_pomodoro)
         button_layout.addWidget(self.pause_btn)
@@ -128,7 +126,7 @@ class OptimizedTimerPanel(QWidget):
         self.stop_btn = QPushButton("停止")
         self.stop_btn.setFixedHeight(56)
         self.stop_btn.setMinimumWidth(120)  # 略窄于开始按钮
-        apply_secondary_button_style(self.stop_btn)  # 描边按钮 - 次级
+        self._init_button(self.stop_btn)  # 描边按钮 - 次级
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self.stop_pomodoro)
         button_layout.addWidget(self.stop_btn)
@@ -141,13 +139,19 @@ class OptimizedTimerPanel(QWidget):
 
         task_label = QLabel("当前任务:")
         task_label.setFont(Fonts.body())
-        task_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
+        task_label.setObjectName("timerFieldLabel")
         task_selector_layout.addWidget(task_label)
 
         self.task_combo = QComboBox()
         self.task_combo.setMinimumHeight(44)
         self.task_combo.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        apply_combo_box_style(self.task_combo)
+        # 宽度由布局拉伸决定：按固定字符数估算尺寸，不逐条测量任务名称
+        self.task_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.task_combo.setMinimumContentsLength(TASK_COMBO_MIN_CHARS)
+        self.task_combo.view().setUniformItemSizes(True)  # 条目均为单行文字，行高一致
+        self.task_combo.setObjectName("timerTaskCombo")
         self.task_combo.currentIndexChanged.connect(self.on_task_changed)
         task_selector_layout.addWidget(self.task_combo)
 
@@ -155,6 +159,20 @@ class OptimizedTimerPanel(QWidget):
 
         main_layout.addWidget(timer_card)
 
+    @staticmethod
+    def _init_button(button: QPushButton, variant: str = ""):
+        """设置按钮的 objectName 和样式变体，外观由全局样式表决定"""
+        button.setObjectName("timerButton")
+        button.setProperty("variant", variant)
+        button.setCursor(Qt.CursorShape.PointingHandCursor)
+
+    @staticmethod
+    def _set_button_variant(button: QPushButton, variant: str):
+        """切换按钮样式变体，变体未变化时跳过重新应用样式"""
+        if button.property("variant") != variant:
+            button.setProperty("variant", variant)
+            repolish(button)
+
     def connect_signals(self):
         """连接信号和槽"""
         self.timer.set_tick_callback(self.on_timer_tick)
@@ -164,31 +182,64 @@ class OptimizedTimerPanel(QWidget):
     def refresh(self):
         """刷新界面"""
         self.refresh_task_list()
+        self._update_time_label()
         self.update_ui_state()
 
     def refresh_task_list(self):
-        """刷新任务列表"""
-        current_task_id = self.get_selected_task_id()
+        """
+        刷新任务列表
+
+        任务数据和条目均未变化时直接返回。否则先在新模型中组装全部条目再
+        一次性设置给下拉框，重建期间屏蔽信号，最后按需同步一次当前任务，
+        避免逐条 addItem 触发选择变化和重绘。
+        """
+        version = self.task_manager.version
+        if version == self._task_list_version:
+            return
+        self._task_list_version = version
 
-        self.task_combo.clear()
-        self.task_combo.addItem("(无任务)", None)
+        grouped = self.task_manager.get_tasks_grouped_by_quadrant()
 
-        for quadrant in range(4):
-            tasks = self.task_manager.get_tasks_by_quadrant(
-                quadrant,
-                include_completed=False
-            )
+        # 番茄钟计数等不影响下拉框的写入也会改变版本号，条目未变化时不重建
+        sig = tuple(
+            (quadrant, task.id, task.description)
+            for quadrant, tasks in grouped.items()
+            for task in tasks
+        )
+        if sig == self._task_list_sig:
+            return
+        self._task_list_sig = sig
+
+        current_task_id = self.get_selected_task_id()
 
+        model = QStandardItemModel(self.task_combo)
+        model.appendRow(QStandardItem("(无任务)"))
+        task_id_to_index = {}
+
+        for quadrant, tasks in grouped.items():
             if tasks:
-                quadrant_name = TaskManager.get_quadrant_name(quadrant)
-                self.task_combo.addItem(f"── {quadrant_name} ──", None)
-                self.task_combo.model().item(self.task_combo.count() - 1).setEnabled(False)
+                header = QStandardItem(f"── {TaskManager.QUADRANT_NAMES[quadrant]} ──")
+                header.setEnabled(False)
+                model.appendRow(header)
 
                 for task in tasks:
-                    self.task_combo.addItem(task.description, task.id)
+                    item = QStandardItem(task.description)
+                    item.setData(task.id, Qt.ItemDataRole.UserRole)
+                    task_id_to_index[task.id] = model.rowCount()
+                    model.appendRow(item)
+
+        self.task_combo.blockSignals(True)
+        try:
+            self.task_combo.setModel(model)
+            self._task_id_to_index = task_id_to_index
+            if current_task_id:
+                self.select_task_by_id(current_task_id)
+        finally:
+            self.task_combo.blockSignals(False)
 
-        if current_task_id:
-            self.select_task_by_id(current_task_id)
+        # 运行中不能更换任务，只在空闲时同步一次选择结果
+        if not self.timer.is_running:
+            self.on_task_changed(self.task_combo.currentIndex())
 
     def get_selected_task_id(self) -> Optional[int]:
         """获取当前选择的任务ID"""
@@ -196,10 +247,9 @@ class OptimizedTimerPanel(QWidget):
 
     def select_task_by_id(self, task_id: int):
         """通过ID选择任务"""
-        for i in range(self.task_combo.count()):
-            if self.task_combo.itemData(i) == task_id:
-                self.task_combo.setCurrentIndex(i)
-                break
+        index = self._task_id_to_index.get(task_id)
+        if index is not None:
+            self.task_combo.setCurrentIndex(index)
 
     def on_task_changed(self, index: int):
         """任务选择变化"""
@@ -208,66 +258,55 @@ class OptimizedTimerPanel(QWidget):
 
         # 更新当前任务显示
         if task_id:
-            task = self.task_manager.get_task(task_id)
+            task = self.task_manager.get_task(task_id, cache=True)
             if task:
                 self.current_task_label.setText(task.description)
         else:
             self.current_task_label.setText("未选择任务")
 
     def on_timer_tick(self, remaining: int, total: int):
-        """计时器tick回调"""
-        self.time_label.setText(self.timer.get_formatted_time())
+        """计时器tick回调（剩余时间由计时器自行格式化，参数不再使用）"""
+        self._update_time_label()
 
-        # 保持主视觉统一：始终使用深色，仅在状态标签上显示颜色
-        # 不再改变倒计时数字颜色，保持视觉稳定性
-        pass
+    def _update_time_label(self):
+        """刷新倒计时标签，文字未变化时跳过 setText 避免重新布局和重绘"""
+        text = self.timer.get_formatted_time()
+        if text != self._last_time_text:
+            self._last_time_text = text
+            self.time_label.setText(text)
 
     def on_timer_state_changed(self, state: TimerState):
         """计时器状态变化回调"""
         self.update_ui_state()
 
-        # 更新状态标签 - 使用更温和的颜色系统
-        state_colors = {
-            TimerState.READY: Colors.TIMER_STATUS,      # 灰蓝
-            TimerState.RUNNING: Colors.SUCCESS,         # 绿色（运行中）
-            TimerState.PAUSED: Colors.WARNING,          # 橙色（暂停）
-            TimerState.COMPLETED: Colors.PRIMARY,       # 蓝色（完成）
-            TimerState.ABANDONED: Colors.TEXT_TERTIARY  # 浅灰（废弃）
-        }
-
-        color = state_colors.get(state, Colors.TIMER_STATUS)
-        self.status_label.setText(state.value)
-        self.status_label.setStyleSheet(f"color: {color}; font-weight: 500;")  # 减轻字重
-
     def on_timer_complete(self):
         """计时器完成回调 - 由 ResponsiveWindow 统一调用"""
         completed_task_id = None
         session_start_time = self.current_session_start_time
 
-        if self.current_session_id is not None:
-            end_time = datetime.now().isoformat()
-            self.storage.end_pomodoro_session(
-                self.current_session_id,
-                end_time,
-                TimerStatus.COMPLETED
-            )
+        # 会话结束、任务计数和完成日志在同一事务中写入，只提交一次
+        with self.storage.transaction():
+            if self.current_session_id is not None:
+                task_id = self.timer.current_task_id
+                self.storage.finalize_pomodoro(
+                    self.current_session_id,
+                    task_id,
+                    TimerStatus.COMPLETED
+                )
 
-            task_id = self.timer.current_task_id
-            if task_id:
-                completed_task_id = task_id
-                self.task_manager.increment_task_pomodoros(task_id)
+                if task_id:
+                    completed_task_id = task_id
 
-        # 自动添加日志
-        if completed_task_id and session_start_time:
-            self._add_completion_log(completed_task_id, session_start_time)
+            # 自动添加日志
+            if completed_task_id and session_start_time:
+                self._add_completion_log(completed_task_id, session_start_time)
 
         self.current_session_id = None
         self.current_session_start_time = None
 
-        # 重置计时器为 READY 状态，方便立即开始下一个番茄钟
+        # 重置计时器为 READY 状态，方便立即开始下一个番茄钟（状态回调负责更新按钮状态）
         self.timer.reset()
-        self.time_label.setText(self.timer.get_formatted_time())
-        self.update_ui_state()
+        self._update_time_label()
 
     def _add_completion_log(self, task_id: int, start_time: str):
         """
@@ -278,16 +317,18 @@ class OptimizedTimerPanel(QWidget):
             start_time: 开始时间
         """
         try:
-            task = self.task_manager.get_task(task_id)
+            task = self.task_manager.get_task(task_id, cache=True)
             if not task:
                 return
 
             # 获取任务类型（象限）
             quadrant_name = TaskManager.get_quadrant_name(task.quadrant)
 
-            # 格式化开始时间
-            start_dt = datetime.fromisoformat(start_time)
-            start_time_str = start_dt.strftime("%H:%M")
+            # 开始时间由 isoformat() 生成（YYYY-MM-DDTHH:MM:SS...），直接截取时分
+            if len(start_time) >= 16 and start_time[10] == "T":
+                start_time_str = start_time[11:16]
+            else:
+                start_time_str = datetime.fromisoformat(start_time).strftime("%H:%M")
 
             # 构建日志内容
             log_content = f"✅ 完成番茄钟 - [{quadrant_name}] {task.description} (开始时间: {start_time_str})"
@@ -300,6 +341,11 @@ class OptimizedTimerPanel(QWidget):
         except Exception as e:
             pass  # 静默失败，不影响主流程
 
+    @staticmethod
+    def _now_iso() -> str:
+        """当前时间的 ISO 8601 字符串（与存储层记录的会话时间格式一致）"""
+        return datetime.now().isoformat()
+
     def on_start_or_resume_clicked(self):
         """处理开始/继续按钮点击"""
         state = self.timer.state
@@ -314,7 +360,7 @@ class OptimizedTimerPanel(QWidget):
     def start_pomodoro(self):
         """开始新的番茄钟"""
         try:
-            start_time = datetime.now().isoformat()
+            start_time = self._now_iso()
             task_id = self.get_selected_task_id()
 
             session_id = self.storage.create_pomodoro_session(task_id, start_time)
@@ -324,8 +370,8 @@ class OptimizedTimerPanel(QWidget):
                 self.current_session_start_time = start_time  # 保存开始时间
                 self.update_ui_state()
             else:
-                end_time = datetime.now().isoformat()
-                self.storage.end_pomodoro_session(session_id, end_time, TimerStatus.ABANDONED)
+                # 启动失败时会话立即结束，沿用同一时间戳
+                self.storage.end_pomodoro_session(session_id, start_time, TimerStatus.ABANDONED)
                 QMessageBox.warning(self, "警告", "计时器启动失败")
                 self.current_session_id = None
                 self.current_session_start_time = None
@@ -362,20 +408,17 @@ class OptimizedTimerPanel(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             if self.current_session_id is not None:
-                end_time = datetime.now().isoformat()
                 self.storage.end_pomodoro_session(
                     self.current_session_id,
-                    end_time,
+                    self._now_iso(),
                     TimerStatus.ABANDONED
                 )
                 self.current_session_id = None
                 self.current_session_start_time = None
 
-            self.timer.stop(abandon=True)
-            # 重置计时器，显示完整的番茄钟时长
-            self.timer.reset()
-            self.time_label.setText(self.timer.get_formatted_time())
-            self.update_ui_state()
+            # 废弃并重置计时器，显示完整的番茄钟时长（状态回调负责更新按钮状态）
+            self.timer.stop_and_reset()
+            self._update_time_label()
 
     def force_complete_pomodoro(self):
         """强制完成番茄钟"""
@@ -388,18 +431,16 @@ class OptimizedTimerPanel(QWidget):
 
         if reply == QMessageBox.StandardButton.Yes:
             if self.current_session_id is not None:
-                end_time = datetime.now().isoformat()
-                self.storage.end_pomodoro_session(
-                    self.current_session_id,
-                    end_time,
-                    TimerStatus.FORCE_COMPLETED
-                )
-
                 task_id = self.timer.current_task_id
-                if task_id:
-                    self.task_manager.increment_task_pomodoros(task_id)
+                with self.storage.transaction():
+                    self.storage.finalize_pomodoro(
+                        self.current_session_id,
+                        task_id,
+                        TimerStatus.FORCE_COMPLETED
+                    )
+
                     # 也添加日志
-                    if self.current_session_start_time:
+                    if task_id and self.current_session_start_time:
                         self._add_completion_log(task_id, self.current_session_start_time)
 
                 self.current_session_id = None
@@ -408,62 +449,33 @@ class OptimizedTimerPanel(QWidget):
             self.timer.force_complete()
 
     def update_ui_state(self):
-        """更新UI状态"""
+        """更新UI状态（样式只在状态切换时重新应用）"""
         state = self.timer.state
 
-        # 更新按钮状态和样式
-        if state == TimerState.READY:
-            self.start_btn.setText("开始")
-            self.start_btn.setEnabled(True)
-            apply_primary_button_style(self.start_btn)
-
-            self.pause_btn.setEnabled(False)
-            self.stop_btn.setEnabled(False)
-            self.task_combo.setEnabled(True)
-
-            self.status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
-
-        elif state == TimerState.RUNNING:
-            self.start_btn.setEnabled(False)
-
-            self.pause_btn.setText("暂停")
-            self.pause_btn.setEnabled(True)
-            apply_primary_button_style(self.pause_btn)
-
-            self.stop_btn.setEnabled(True)
-            self.task_combo.setEnabled(False)
-
-            self.status_label.setStyleSheet(f"color: {Colors.SUCCESS};")
-
-        elif state == TimerState.PAUSED:
-            self.start_btn.setText("继续")
-            self.start_btn.setEnabled(True)
-            apply_primary_button_style(self.start_btn)
-
-            self.pause_btn.setEnabled(False)
-            self.stop_btn.setEnabled(True)
-            self.task_combo.setEnabled(False)
-
-            self.status_label.setStyleSheet(f"color: {Colors.WARNING};")
-
-        elif state == TimerState.COMPLETED:
-            self.start_btn.setEnabled(False)
-            self.pause_btn.setEnabled(False)
-            self.stop_btn.setEnabled(False)
-            self.task_combo.setEnabled(True)
-
-            self.status_label.setStyleSheet(f"color: {Colors.PRIMARY};")
-
-        elif state == TimerState.ABANDONED:
-            self.start_btn.setText("开始")
-            self.start_btn.setEnabled(True)
-            apply_primary_button_style(self.start_btn)
-
-            self.pause_btn.setEnabled(False)
-            self.stop_btn.setEnabled(False)
-            self.task_combo.setEnabled(True)
-
-            self.status_label.setStyleSheet(f"color: {Colors.TEXT_TERTIARY};")
+        config = self._STATE_UI_CONFIG.get(state)
+        if config is not None:
+            start_text, start_enabled, pause_enabled, stop_enabled, combo_enabled = config
+
+            if start_text is not None:
+                self.start_btn.setText(start_text)
+            self.start_btn.setEnabled(start_enabled)
+            self.pause_btn.setEnabled(pause_enabled)
+            self.stop_btn.setEnabled(stop_enabled)
+            self.task_combo.setEnabled(combo_enabled)
+
+            # 首次开始后暂停按钮切换为主按钮样式
+            if state == TimerState.RUNNING:
+                self._set_button_variant(self.pause_btn, "primary")
+
+        self._set_status_state(state)
+
+    def _set_status_state(self, state: TimerState):
+        """切换状态标签的文字和 state 属性，状态未变化时跳过"""
+        if state != self._status_state:
+            self._status_state = state
+            self.status_label.setText(state.value)
+            self.status_label.setProperty("state", state.name.lower())
+            repolish(self.status_label)
 
     def focus_log_input(self):
         """聚焦到日志输入框（已移除，保留接口兼容）"""
@@ -3,20 +3,43 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QCalendarWidget, QFrame, QScrollArea, QSplitter,
-    QSizePolicy, QTextEdit, QTabWidget
+    QSizePolicy, QTextEdit, QTabWidget, QMessageBox
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QColor, QTextCharFormat, QBrush, QFont
+from PyQt6.QtCore import Qt, QDate, QTimer
+from PyQt6.QtGui import QColor, QTextCharFormat, QBrush
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Optional
+import re
 from core.statistics import DailyStatistics
 from core.statistics import Statistics
+from core.task_manager import TaskManager
 from utils.logger import Logger
 from gui.styles import (
     Colors, Fonts, Spacing
 )
 
 
+# 象限名称到颜色的映射（解析日志中的象限标签时使用）
+QUADRANT_COLORS_BY_NAME = dict(zip(TaskManager.QUADRANT_NAMES, Colors.QUADRANTS))
+
+
+def _calendar_mark_format(bg_color: str, text_color: str) -> QTextCharFormat:
+    """创建日历日期标记格式"""
+    fmt = QTextCharFormat()
+    fmt.setBackground(QBrush(QColor(bg_color)))
+    fmt.setForeground(QBrush(QColor(text_color)))
+    return fmt
+
+
+# 日历日期标记：(番茄钟数下限, 格式)，按下限从高到低排列，格式只创建一次
+CALENDAR_MARK_FORMATS = (
+    (8, _calendar_mark_format(Colors.CALENDAR_HAS_DATA_HIGH, Colors.TEXT_WHITE)),  # 深蓝标记
+    (5, _calendar_mark_format(Colors.CALENDAR_HAS_DATA, Colors.TEXT_PRIMARY)),     # 浅蓝标记
+    (1, _calendar_mark_format("#DBEAFE", Colors.PRIMARY)),  # 非常浅的蓝背景 + 蓝色文字
+)
+
+
 # 日历样式 - 温和回顾风格
 CALENDAR_CARD_STYLE = """
     QFrame {{
@@ -157,10 +180,9 @@ class CompletedTasksPanel(QFrame):
             return
 
         # 按完成日期分组
-        from collections import defaultdict
         tasks_by_date = defaultdict(list)
         for task in completed_tasks:
-            completed_date = task.get('completed_date')
+            completed_date = task['completed_date']
             if completed_date:
                 # 只取日期部分（YYYY-MM-DD）
                 date_only = completed_date.split('T')[0] if 'T' in completed_date else completed_date
@@ -169,8 +191,8 @@ class CompletedTasksPanel(QFrame):
         # 按日期排序（最新的在前）
         sorted_dates = sorted(tasks_by_date.keys(), reverse=True)
 
-        quadrant_names = ["重要紧急", "重要不紧急", "紧急不重要", "不紧急不重要"]
-        quadrant_colors = [Colors.QUADRANT_0, Colors.QUADRANT_1, Colors.QUADRANT_2, Colors.QUADRANT_3]
+        quadrant_names = TaskManager.QUADRANT_NAMES
+        quadrant_colors = Colors.QUADRANTS
 
         # 构建HTML：日期分组 + 任务卡片
         html = "<div style='display: flex; flex-direction: column; gap: 16px;'>"
@@ -549,8 +571,8 @@ class DateDetailPanel(QFrame):
         # 更新任务列表
         if stats.completed_tasks:
             task_html = f"<div style='font-size: 13px;'>"
-            quadrant_names = ["重要紧急", "重要不紧急", "紧急不重要", "不紧急不重要"]
-            quadrant_colors = [Colors.QUADRANT_0, Colors.QUADRANT_1, Colors.QUADRANT_2, Colors.QUADRANT_3]
+            quadrant_names = TaskManager.QUADRANT_NAMES
+            quadrant_colors = Colors.QUADRANTS
 
             for task in stats.completed_tasks:
                 quadrant_name = quadrant_names[task['quadrant']]
@@ -651,19 +673,11 @@ class DateDetailPanel(QFrame):
         """
         # 提取象限标签和任务名称
         # 格式: "✅ 完成番茄钟 - [重要紧急] 任务名称 (开始时间: HH:MM)"
-        import re
-
         # 匹配象限标签
         quadrant_match = re.search(r'\[([^\]]+)\]', content)
         if quadrant_match:
             quadrant_name = quadrant_match.group(1)
-            quadrant_colors = {
-                "重要紧急": Colors.QUADRANT_0,
-                "重要不紧急": Colors.QUADRANT_1,
-                "紧急不重要": Colors.QUADRANT_2,
-                "不紧急不重要": Colors.QUADRANT_3
-            }
-            quadrant_color = quadrant_colors.get(quadrant_name, Colors.TEXT_SECONDARY)
+            quadrant_color = QUADRANT_COLORS_BY_NAME.get(quadrant_name, Colors.TEXT_SECONDARY)
 
             # 替换象限标签为带颜色的标签
             content = re.sub(
@@ -683,7 +697,6 @@ class DateDetailPanel(QFrame):
     def save_reflection(self):
         """保存心得感悟"""
         if not self.current_date:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "提示", "请先选择一个日期")
             return
 
@@ -713,13 +726,10 @@ class DateDetailPanel(QFrame):
                 """)
 
                 # 2秒后恢复按钮文本
-                from PyQt6.QtCore import QTimer
                 QTimer.singleShot(2000, self._reset_save_button)
             else:
-                from PyQt6.QtWidgets import QMessageBox
                 QMessageBox.warning(self, "警告", "保存后验证失败，请检查是否正确保存")
         else:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "错误", "保存失败，请重试")
 
     def _reset_save_button(self):
@@ -926,27 +936,15 @@ class ResponsiveHistoryView(QWidget):
         monthly_stats = self.statistics.get_monthly_statistics(year, month)
 
         # 为有番茄钟的日期设置格式（使用标记而非填充）
-        for day, count in monthly_stats.days_with_data.items():
+        for day, count in enumerate(monthly_stats.days_with_data):
             if count > 0:
-                date = QDate(year, month, int(day))
+                date = QDate(year, month, day)
 
                 # 根据番茄钟数量设置浅色标记（温和回顾）
-                if count >= 8:
-                    bg_color = Colors.CALENDAR_HAS_DATA_HIGH  # 深蓝标记
-                    text_color = Colors.TEXT_WHITE
-                elif count >= 5:
-                    bg_color = Colors.CALENDAR_HAS_DATA  # 浅蓝标记
-                    text_color = Colors.TEXT_PRIMARY
-                else:
-                    # 使用浅色背景 + 蓝色文字的标记方式
-                    bg_color = "#DBEAFE"  # 非常浅的蓝
-                    text_color = Colors.PRIMARY
-
-                fmt = QTextCharFormat()
-                fmt.setBackground(QBrush(QColor(bg_color)))
-                fmt.setForeground(QBrush(QColor(text_color)))
-
-                self.calendar.setDateTextFormat(date, fmt)
+                for threshold, fmt in CALENDAR_MARK_FORMATS:
+                    if count >= threshold:
+                        self.calendar.setDateTextFormat(date, fmt)
+                        break
 
     def on_date_selected(self):
         """日期选择变化"""
@@ -1,22 +1,23 @@
 """响应式主窗口 - 基于屏幕尺寸的自适应布局"""
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QMenuBar, QMessageBox, QScrollArea, QFrame
+    QMainWindow, QWidget, QVBoxLayout, QSplitter,
+    QMessageBox, QScrollArea, QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize, QEvent, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QKeySequence
-import sys
+from datetime import datetime
 
-from data.storage import Storage
+from data.storage import Storage, TimerStatus
 from core.task_manager import TaskManager
-from core.pomodoro_timer import PomodoroTimer
+from core.pomodoro_timer import QtPomodoroTimer
 from core.statistics import Statistics
 from utils.logger import Logger
 from config import Config
 from gui.styles import Colors, Spacing
 from gui.optimized_timer_panel import OptimizedTimerPanel
 from gui.optimized_quadrants_view import OptimizedQuadrantsView
+from gui.dashboard import TodayDashboard
 from gui.responsive_history_view import ResponsiveHistoryView
 
 
@@ -40,7 +41,7 @@ class ResponsiveWindow(QMainWindow):
 
         # 从配置获取番茄钟时长
         timer_duration = Config.get_timer_duration()
-        self.timer = PomodoroTimer(duration_seconds=timer_duration)
+        self.timer = QtPomodoroTimer(duration_seconds=timer_duration)
         self.statistics = Statistics(self.storage)
         self.logger = Logger(self.storage)
 
@@ -131,7 +132,6 @@ class ResponsiveWindow(QMainWindow):
         center_layout.addWidget(self.timer_panel, stretch=1)
 
         # Dashboard（自适应页面高度）
-        from gui.dashboard import TodayDashboard
         self.dashboard_wrapper = TodayDashboard()
 
         # 直接添加到布局，不使用滚动区域
@@ -179,7 +179,6 @@ class ResponsiveWindow(QMainWindow):
         self.connect_signals()
 
         # 设置定时更新（每分钟更新Dashboard）
-        from PyQt6.QtCore import QTimer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_dashboard)
         self.update_timer.start(60000)
@@ -191,7 +190,6 @@ class ResponsiveWindow(QMainWindow):
         """事件过滤器 - 监听窗口大小变化"""
         if obj is self and event.type() == QEvent.Type.Resize:
             # 延迟处理，避免频繁触发
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(100, self.on_window_resized)
         return super().eventFilter(obj, event)
 
@@ -327,7 +325,8 @@ class ResponsiveWindow(QMainWindow):
         self.timer_panel.log_added.connect(self.on_log_added)
 
     def on_timer_state_changed(self, state):
-        """计时器状态变化"""
+        """计时器状态变化（计时器只保存一个状态回调，由主窗口转发给计时器面板）"""
+        self.timer_panel.on_timer_state_changed(state)
         self.quadrants_view.refresh()
 
     def on_timer_complete(self):
@@ -344,8 +343,7 @@ class ResponsiveWindow(QMainWindow):
         self.show_notification("番茄钟完成", "恭喜！你完成了一个番茄钟。")
 
     def on_task_updated(self):
-        """任务更新"""
-        self.quadrants_view.refresh()
+        """任务更新（四象限视图已自行刷新受影响的象限）"""
         self.update_dashboard()
         self.timer_panel.refresh_task_list()
         # 刷新历史记录（包括"已完成任务"和"日期详情"）
@@ -365,7 +363,6 @@ class ResponsiveWindow(QMainWindow):
 
     def update_dashboard(self):
         """更新Dashboard"""
-        from datetime import datetime
         today = datetime.now().strftime("%Y-%m-%d")
         daily_stats = self.statistics.get_daily_statistics(today)
         self.dashboard_wrapper.update_dashboard(daily_stats)
@@ -392,8 +389,6 @@ class ResponsiveWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.Yes:
             # 结束当前会话（如果有）
             if self.timer_panel.current_session_id is not None:
-                from datetime import datetime
-                from data.storage import TimerStatus
                 end_time = datetime.now().isoformat()
                 self.task_manager.storage.end_pomodoro_session(
                     self.timer_panel.current_session_id,
@@ -403,9 +398,8 @@ class ResponsiveWindow(QMainWindow):
                 self.timer_panel.current_session_id = None
                 self.timer_panel.current_session_start_time = None
 
-            self.timer.stop(abandon=True)
-            # 重置计时器，显示完整的番茄钟时长
-            self.timer.reset()
+            # 废弃并重置计时器，显示完整的番茄钟时长
+            self.timer.stop_and_reset()
             self.timer_panel.refresh()
 
     def refresh_all(self):
@@ -417,9 +411,6 @@ class ResponsiveWindow(QMainWindow):
 
     def export_data(self):
         """导出数据"""
-        from datetime import datetime
-        from PyQt6.QtWidgets import QFileDialog
-
         default_filename = f"pomodoro_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         filename, _ = QFileDialog.getSaveFileName(
@@ -1,7 +1,9 @@
 """全局样式系统 - macOS原生极简风格"""
 
-from PyQt6.QtGui import QColor, QPalette, QFont, QBrush
+from functools import lru_cache
+from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
 
 # ==================== 颜色系统 ====================
 
@@ -13,6 +15,7 @@ class Colors:
     BG_CARD = "#FFFFFF"            # 卡片背景
     BG_HOVER = "#F9FAFB"           # 悬停背景
     BG_SELECTED = "#EFF6FF"        # 选中背景
+    BG_CARD_ACTIVE = "#F0F9FF"     # 有数据的统计卡片背景
 
     # 番茄钟核心区背景（视觉锚点）
     BG_TIMER = "#EAF2FF"           # 番茄钟专属淡蓝背景
@@ -20,6 +23,7 @@ class Colors:
     # 分割线
     BORDER = "#E5E7EB"             # 边框、分割线
     BORDER_LIGHT = "#F3F4F6"       # 浅色分割线
+    BORDER_SHADOW = "#DADDE2"      # 卡片底边（模拟阴影）
 
     # 文字色
     TEXT_PRIMARY = "#111827"       # 主文字
@@ -43,6 +47,7 @@ class Colors:
     QUADRANT_1 = WARNING           # 重要不紧急
     QUADRANT_2 = "#4B5563"         # 紧急不重要（深灰）
     QUADRANT_3 = "#9CA3AF"         # 不紧急不重要（浅灰）
+    QUADRANTS = (QUADRANT_0, QUADRANT_1, QUADRANT_2, QUADRANT_3)  # 按象限编号索引
 
     # 日历色（温和回顾风格）
     CALENDAR_BG = "#F7F8FA"        # 日历背景
@@ -60,9 +65,15 @@ class Colors:
 # ==================== 字体系统 ====================
 
 class Fonts:
-    """字体规范"""
+    """
+    字体规范
+
+    同一字号的字体只创建一次，各控件共享（setFont 会复制字体，
+    调用方不要修改返回的字体对象）。
+    """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def title(size=18):
         """标题字体 Semi-Bold"""
         font = QFont()
@@ -72,6 +83,7 @@ class Fonts:
         return font
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def body(size=14):
         """正文字体 Regular"""
         font = QFont()
@@ -81,6 +93,7 @@ class Fonts:
         return font
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def caption(size=13):
         """辅助字体"""
         font = QFont()
@@ -90,6 +103,7 @@ class Fonts:
         return font
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def timer_display(size=80):
         """计时器数字（等宽）"""
         font = QFont()
@@ -99,6 +113,7 @@ class Fonts:
         return font
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def timer_extra_bold(size=88):
         """计时器主显示（超大+超粗）- 视觉锚点"""
         font = QFont()
@@ -414,8 +429,305 @@ class Stylesheets:
         }}
     """
 
+    # ========== 任务对话框（全局样式，按 objectName 和动态属性匹配）==========
+    # 底部按钮沿用通用样式，只把选择器限定到对话框按钮上
+    TASK_DIALOG = (
+        BUTTON_SECONDARY.replace("QPushButton", "QPushButton#dialogButton")
+        + BUTTON_PRIMARY.replace("QPushButton", 'QPushButton#dialogButton[variant="primary"]')
+    ) + f"""
+        QDialog#taskDialog {{
+            background-color: {Colors.BG_GLOBAL};
+        }}
+
+        QFrame#dialogCard {{
+            background-color: {Colors.BG_CARD};
+            border-radius: {Spacing.RADIUS_CARD}px;
+            border: 1px solid {Colors.BORDER};
+        }}
+
+        QFrame#dialogDivider {{
+            background-color: {Colors.BORDER};
+        }}
+
+        QLabel#dialogTitle {{
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QLabel#dialogSubtitle, QLabel#fieldUnit {{
+            color: {Colors.TEXT_SECONDARY};
+        }}
+
+        QLabel#fieldLabel {{
+            color: {Colors.TEXT_PRIMARY};
+            font-weight: 600;
+        }}
+
+        QLineEdit#taskNameInput {{
+            background-color: {Colors.BG_CARD};
+            border: 1px solid {Colors.BORDER};
+            border-radius: {Spacing.RADIUS_BUTTON}px;
+            padding: {Spacing.MD}px;
+            font-size: 13px;
+            color: {Colors.TEXT_PRIMARY};
+            selection-background-color: {Colors.PRIMARY};
+        }}
+
+        QLineEdit#taskNameInput:focus {{
+            border-color: {Colors.PRIMARY};
+        }}
+
+        QLineEdit#taskNameInput[error="true"] {{
+            border-color: {Colors.DANGER};
+            font-size: 14px;
+        }}
+
+        QLabel#fieldError {{
+            color: {Colors.DANGER};
+        }}
+
+        QSpinBox#pomodoroInput {{
+            background-color: {Colors.BG_CARD};
+            border: 1px solid {Colors.BORDER};
+            border-radius: {Spacing.RADIUS_BUTTON}px;
+            padding: {Spacing.MD}px;
+            font-size: 14px;
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QSpinBox#pomodoroInput:focus {{
+            border-color: {Colors.PRIMARY};
+        }}
+
+        QSpinBox#pomodoroInput::up-button, QSpinBox#pomodoroInput::down-button {{
+            width: 32px;
+            border: none;
+            background-color: {Colors.BG_HOVER};
+        }}
+
+        QSpinBox#pomodoroInput::up-button:hover, QSpinBox#pomodoroInput::down-button:hover {{
+            background-color: {Colors.BG_SELECTED};
+        }}
+
+        QRadioButton#quadrantRadio {{
+            color: {Colors.TEXT_PRIMARY};
+            spacing: {Spacing.SM}px;
+        }}
+
+        QRadioButton#quadrantRadio::indicator {{
+            width: 18px;
+            height: 18px;
+        }}
+    """ + "".join(
+        f"""
+        QRadioButton#quadrantRadio[quadrant="{q_id}"]::indicator:checked {{
+            background-color: {q_color};
+            border: 2px solid {q_color};
+            border-radius: 9px;
+        }}
+        """
+        for q_id, q_color in enumerate(Colors.QUADRANTS)
+    )
+
+    # ========== 统计卡片（全局样式，按 objectName 和动态属性匹配）==========
+    # 不使用 QGraphicsDropShadowEffect：它每次重绘都要离屏渲染整张卡片，
+    # 改为底边略深的描边来模拟向下偏移的阴影
+    STAT_CARD = f"""
+        QFrame#statCard {{
+            background-color: {Colors.BG_CARD};
+            border-radius: 12px;
+            border: 1px solid {Colors.BORDER};
+            border-bottom: 2px solid {Colors.BORDER_SHADOW};
+        }}
+
+        QFrame#statCard[hasData="true"] {{
+            background-color: {Colors.BG_CARD_ACTIVE};
+            border: 1px solid {Colors.PRIMARY};
+            border-bottom: 2px solid {Colors.PRIMARY};
+        }}
+
+        QLabel#statValue {{
+            color: {Colors.TEXT_TERTIARY};
+        }}
+
+        QLabel#statValue[state="primary"] {{
+            color: {Colors.PRIMARY};
+            font-weight: bold;
+        }}
+
+        QLabel#statValue[state="success"] {{
+            color: {Colors.SUCCESS};
+            font-weight: bold;
+        }}
+
+        QLabel#statValue[state="warning"] {{
+            color: {Colors.WARNING};
+            font-weight: bold;
+        }}
+    """
+
+    # ========== 四象限视图（全局样式，按 objectName 匹配）==========
+    QUADRANT_VIEW = f"""
+        QFrame#quadrantCard {{
+            background-color: {Colors.BG_CARD};
+            border-radius: {Spacing.RADIUS_CARD}px;
+            border: 1px solid {Colors.BORDER};
+        }}
+
+        QLabel#quadrantColorBar {{
+            border-radius: 2px;
+        }}
+
+        QLabel#quadrantTitle {{
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QLabel#quadrantCount {{
+            color: {Colors.TEXT_SECONDARY};
+        }}
+
+        QListView#quadrantTaskList {{
+            background-color: transparent;
+            border: none;
+            outline: none;
+        }}
+
+        QListView#quadrantTaskList::item {{
+            border-radius: {Spacing.RADIUS_SMALL}px;
+            padding: {Spacing.SM}px {Spacing.MD}px;
+            margin-bottom: {Spacing.XS}px;
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QListView#quadrantTaskList::item:hover {{
+            background-color: {Colors.BG_HOVER};
+        }}
+
+        QListView#quadrantTaskList::item:selected {{
+            background-color: {Colors.BG_SELECTED};
+            color: {Colors.PRIMARY};
+        }}
+
+        QPushButton#quadrantAddBtn {{
+            background-color: transparent;
+            color: {Colors.PRIMARY};
+            border: 1px dashed {Colors.PRIMARY};
+            border-radius: {Spacing.RADIUS_BUTTON}px;
+            font-size: 13px;
+            font-weight: 600;
+        }}
+
+        QPushButton#quadrantAddBtn:hover {{
+            background-color: {Colors.BG_SELECTED};
+            border-color: {Colors.PRIMARY_HOVER};
+        }}
+
+        QMenu#quadrantMenu {{
+            background-color: {Colors.BG_CARD};
+            border: 1px solid {Colors.BORDER};
+            border-radius: {Spacing.RADIUS_SMALL}px;
+            padding: {Spacing.XS}px;
+        }}
+
+        QMenu#quadrantMenu::item, QMenu#quadrantMoveMenu::item {{
+            padding: {Spacing.SM}px {Spacing.MD}px;
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QMenu#quadrantMenu::item:selected, QMenu#quadrantMoveMenu::item:selected {{
+            background-color: {Colors.BG_SELECTED};
+        }}
+
+        QMenu#quadrantMoveMenu {{
+            background-color: {Colors.BG_CARD};
+            border: 1px solid {Colors.BORDER};
+            border-radius: {Spacing.RADIUS_SMALL}px;
+        }}
+
+        QTabWidget#quadrantTabs::pane {{
+            border: none;
+            background-color: transparent;
+        }}
+
+        QTabWidget#quadrantTabs QTabBar::tab {{
+            background-color: transparent;
+            color: {Colors.TEXT_SECONDARY};
+            padding: {Spacing.MD}px {Spacing.LG}px;
+            margin-right: {Spacing.SM}px;
+            border: none;
+            font-size: 13px;
+            font-weight: 500;
+        }}
+
+        QTabWidget#quadrantTabs QTabBar::tab:hover {{
+            color: {Colors.TEXT_PRIMARY};
+        }}
+
+        QTabWidget#quadrantTabs QTabBar::tab:selected {{
+            color: {Colors.PRIMARY};
+        }}
+    """ + "".join(
+        f"""
+        QLabel#quadrantColorBar[quadrant="{q_id}"] {{
+            background-color: {q_color};
+        }}
+        """
+        for q_id, q_color in enumerate(Colors.QUADRANTS)
+    )
+
+    # ========== 计时器面板（全局样式，按 objectName 和动态属性匹配）==========
+    # 按钮和下拉框沿用通用样式，只把选择器限定到计时器面板的控件上
+    TIMER_PANEL = (
+        BUTTON_SECONDARY.replace("QPushButton", "QPushButton#timerButton")
+        + BUTTON_PRIMARY.replace("QPushButton", 'QPushButton#timerButton[variant="primary"]')
+        + COMBO_BOX.replace("QComboBox", "QComboBox#timerTaskCombo")
+    ) + f"""
+        QFrame#timerCard {{
+            background-color: {Colors.BG_TIMER};
+            border-radius: {Spacing.RADIUS_TIMER_CARD}px;
+            border: 1px solid {Colors.BORDER};
+        }}
+
+        QLabel#timerTask, QLabel#timerFieldLabel {{
+            color: {Colors.TEXT_SECONDARY};
+        }}
+
+        QLabel#timerDisplay {{
+            color: {Colors.TIMER_DISPLAY};
+        }}
+
+        QLabel#timerStatus {{
+            color: {Colors.TIMER_STATUS};
+            font-weight: 500;
+        }}
+
+        QLabel#timerStatus[state="running"] {{
+            color: {Colors.SUCCESS};
+        }}
+
+        QLabel#timerStatus[state="paused"] {{
+            color: {Colors.WARNING};
+        }}
+
+        QLabel#timerStatus[state="completed"] {{
+            color: {Colors.PRIMARY};
+        }}
+
+        QLabel#timerStatus[state="abandoned"] {{
+            color: {Colors.TEXT_TERTIARY};
+        }}
+    """
+
+    # ========== 应用全局样式 ==========
+    APP = """
+        * {
+            font-family: "Helvetica Neue", Arial, sans-serif;
+        }
+    """ + TASK_DIALOG + STAT_CARD + QUADRANT_VIEW + TIMER_PANEL
+
 # ==================== 工具函数 ====================
 
+_APP_STYLESHEET_MARKER = "appStylesheetInstalled"  # 记录在 QApplication 上的已安装标记
+
 def apply_card_style(widget):
     """应用卡片样式"""
     widget.setStyleSheet(Stylesheets.CARD)
@@ -450,3 +762,25 @@ def apply_list_style(list_widget):
 def apply_scroll_bar_style(widget):
     """应用滚动条样式"""
     widget.setStyleSheet(Stylesheets.SCROLL_BAR)
+
+def install_app_stylesheet():
+    """
+    将全局样式表安装到 QApplication（每个应用实例只安装一次）
+
+    全局样式只解析一次，各控件通过 objectName 和动态属性匹配规则，
+    无需逐个调用 setStyleSheet。已安装标记保存在应用实例自身的动态属性上，
+    重新创建 QApplication 后会为新实例重新安装。
+    """
+    app = QApplication.instance()
+    if app is None or app.property(_APP_STYLESHEET_MARKER):
+        return
+
+    app.setStyleSheet(Stylesheets.APP)
+    app.setProperty(_APP_STYLESHEET_MARKER, True)
+
+def repolish(widget):
+    """动态属性变化后重新应用样式"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -17,7 +17,6 @@ def check_screen_resolution():
     """检查并显示屏幕分辨率信息"""
     try:
         from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtGui import QScreen
 
         app = QApplication.instance()
         if app is None:
@@ -66,18 +65,15 @@ def main():
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import Qt
     from gui.responsive_window import ResponsiveWindow
+    from gui.styles import install_app_stylesheet
 
     # 创建应用
     app = QApplication(sys.argv)
     app.setApplicationName("番茄钟效率工具")
     app.setOrganizationName("PomodoroFocusPro")
 
-    # 设置高DPI支持
-    app.setStyleSheet("""
-        * {
-            font-family: "Helvetica Neue", Arial, sans-serif;
-        }
-    """)
+    # 全局样式表（字体及对话框等按 objectName 匹配的样式），启动时解析一次
+    install_app_stylesheet()
 
     # 创建并显示主窗口
     window = ResponsiveWindow()
@@ -0,0 +1,55 @@
+"""配置单元测试。"""
+
+import pytest
+import os
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+
+@pytest.fixture
+def clean_config(monkeypatch):
+    """清除相关环境变量和配置缓存，测试结束后恢复"""
+    monkeypatch.delenv('POMODORO_TEST_MODE', raising=False)
+    monkeypatch.delenv('POMODORO_DURATION_SECONDS', raising=False)
+    Config.invalidate()
+    yield monkeypatch
+    Config.invalidate()
+
+
+class TestConfig:
+    """配置测试"""
+
+    def test_default_duration(self, clean_config):
+        """测试未设置环境变量时使用默认时长"""
+        assert Config.get_timer_duration() == 30 * 60
+        assert Config.is_test_mode() is False
+
+    def test_duration_is_cached(self, clean_config):
+        """测试首次读取后缓存，环境变量变化不影响已缓存的值"""
+        clean_config.setenv('POMODORO_DURATION_SECONDS', '120')
+        assert Config.get_timer_duration() == 120
+
+        clean_config.setenv('POMODORO_DURATION_SECONDS', '300')
+        assert Config.get_timer_duration() == 120
+
+    def test_invalidate_reloads_duration(self, clean_config):
+        """测试 invalidate() 后重新读取自定义时长"""
+        clean_config.setenv('POMODORO_DURATION_SECONDS', '120')
+        assert Config.get_timer_duration() == 120
+
+        clean_config.setenv('POMODORO_DURATION_SECONDS', '300')
+        Config.invalidate()
+        assert Config.get_timer_duration() == 300
+
+    def test_invalidate_reloads_test_mode(self, clean_config):
+        """测试 invalidate() 后重新读取测试模式"""
+        assert Config.is_test_mode() is False
+        assert Config.get_timer_duration() == 30 * 60
+
+        clean_config.setenv('POMODORO_TEST_MODE', 'true')
+        Config.invalidate()
+        assert Config.is_test_mode() is True
+        assert Config.get_timer_duration() == 10
@@ -0,0 +1,69 @@
+"""界面集成测试 - 需要可用的 PyQt6 QtWidgets。"""
+
+import pytest
+import os
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets", exc_type=ImportError)
+
+from core.pomodoro_timer import TimerState
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    """在临时目录中创建主窗口（数据库文件写入临时目录）"""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.chdir(tmp_path)
+
+    from gui.responsive_window import ResponsiveWindow
+    win = ResponsiveWindow()
+    monkeypatch.setattr(win, "show_notification", lambda title, message: None)
+    yield win
+    win.timer.stop_and_reset()
+    win.storage.close()
+    win.deleteLater()
+    app.processEvents()
+
+
+class TestTimerPanelState:
+    """计时器面板按钮状态测试类"""
+
+    def test_start_enabled_after_stop(self, window, monkeypatch):
+        """测试停止番茄钟后可以立即开始下一个"""
+        panel = window.timer_panel
+        monkeypatch.setattr(
+            QtWidgets.QMessageBox, "question",
+            staticmethod(lambda *args, **kwargs: QtWidgets.QMessageBox.StandardButton.Yes)
+        )
+
+        panel.start_pomodoro()
+        assert window.timer.state == TimerState.RUNNING
+        assert not panel.start_btn.isEnabled()
+        assert panel.status_label.text() == TimerState.RUNNING.value
+
+        panel.stop_pomodoro()
+        assert window.timer.state == TimerState.READY
+        assert panel.start_btn.isEnabled()
+        assert not panel.stop_btn.isEnabled()
+        assert panel.status_label.text() == TimerState.READY.value
+
+    def test_start_enabled_after_completion(self, window):
+        """测试番茄钟完成后可以立即开始下一个"""
+        panel = window.timer_panel
+
+        panel.start_pomodoro()
+        assert not panel.start_btn.isEnabled()
+
+        # 完成回调由主窗口转发给计时器面板，面板重置计时器
+        window.timer.force_complete()
+        assert window.timer.state == TimerState.READY
+        assert panel.start_btn.isEnabled()
+        assert not panel.pause_btn.isEnabled()
+        assert panel.status_label.text() == TimerState.READY.value
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
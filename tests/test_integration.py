@@ -2,7 +2,9 @@
 
 import pytest
 import os
+import sqlite3
 import tempfile
+import threading
 import time
 from datetime import datetime
 
@@ -247,6 +249,163 @@ class TestIntegration:
         assert monthly.total_pomodoros >= 6
         assert monthly.days_with_pomodoros >= 1
 
+    def test_storage_transaction(self, temp_db):
+        """测试事务内的多次写入整体提交或回滚"""
+        task_id = temp_db.create_task("事务测试", quadrant=0)
+
+        with temp_db.transaction():
+            temp_db.increment_task_pomodoros(task_id)
+            temp_db.create_log("事务日志", task_id)
+            # 事务内读取能看到尚未提交的写入
+            assert temp_db.get_task(task_id)['actual_pomodoros'] == 1
+
+        assert temp_db.get_task(task_id)['actual_pomodoros'] == 1
+        assert len(temp_db.get_logs_by_task(task_id)) == 1
+
+        with pytest.raises(RuntimeError):
+            with temp_db.transaction():
+                temp_db.increment_task_pomodoros(task_id)
+                temp_db.create_log("回滚日志", task_id)
+                raise RuntimeError("中断")
+
+        assert temp_db.get_task(task_id)['actual_pomodoros'] == 1
+        assert len(temp_db.get_logs_by_task(task_id)) == 1
+
+    def test_finalize_pomodoro(self, temp_db):
+        """测试一次调用结束会话并更新任务计数"""
+        task_id = temp_db.create_task("收尾测试", quadrant=0)
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        session_id = temp_db.create_pomodoro_session(task_id, datetime.now().isoformat())
+        assert temp_db.finalize_pomodoro(session_id, task_id, TimerStatus.COMPLETED) is True
+
+        assert temp_db.get_task(task_id)['actual_pomodoros'] == 1
+        assert temp_db.get_daily_pomodoro_count(today) == 1
+
+        # 废弃的番茄钟不增加任务计数
+        session_id = temp_db.create_pomodoro_session(task_id, datetime.now().isoformat())
+        temp_db.finalize_pomodoro(session_id, task_id, TimerStatus.ABANDONED)
+
+        assert temp_db.get_task(task_id)['actual_pomodoros'] == 1
+        assert temp_db.get_pomodoro_session(session_id)['status'] == TimerStatus.ABANDONED.value
+
+    def test_tasks_completed_on_date_range(self, temp_db):
+        """测试按完成日期查询只返回当天完成的任务"""
+        ids = [temp_db.create_task(f"任务{i}", quadrant=0) for i in range(3)]
+        completed_dates = ["2026-10-14T23:59:59", "2026-10-15T00:00:00", "2026-10-16T00:00:00"]
+        for task_id, completed_date in zip(ids, completed_dates):
+            temp_db.conn.execute(
+                "UPDATE tasks SET is_completed = 1, completed_date = ? WHERE id = ?",
+                (completed_date, task_id)
+            )
+        temp_db.conn.commit()
+
+        assert [row['id'] for row in temp_db.get_tasks_completed_on("2026-10-15")] == [ids[1]]
+
+        plan = " ".join(row[3] for row in temp_db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks "
+            "WHERE is_completed = 1 AND completed_date >= ? AND completed_date < ?",
+            ("2026-10-15", "2026-10-16")
+        ))
+        assert "idx_tasks_completed" in plan and "completed_date>?" in plan
+
+    def test_invalid_session_start_time(self, temp_db):
+        """测试无效的会话开始时间被拒绝且不写入"""
+        with pytest.raises(ValueError):
+            temp_db.create_pomodoro_session(None, "15/10/2026 10:00")
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        assert temp_db.get_pomodoro_sessions_by_date(today) == []
+
+    def test_read_from_worker_threads(self, temp_db):
+        """测试多个线程各自使用只读连接读取已提交的数据"""
+        task_manager = TaskManager(temp_db)
+        for q in range(4):
+            task_manager.create_task(f"象限{q}任务", quadrant=q)
+
+        results = {}
+
+        def read_quadrant(q):
+            results[q] = len(temp_db.get_tasks_by_quadrant(q))
+
+        threads = [threading.Thread(target=read_quadrant, args=(q,)) for q in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {0: 1, 1: 1, 2: 1, 3: 1}
+
+    def test_read_after_close(self):
+        """测试关闭后读写都会报错，不会复用或新建连接"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        storage = Storage(path)
+        try:
+            task_id = storage.create_task("关闭测试", quadrant=0)
+            assert storage.get_task(task_id)['description'] == "关闭测试"
+
+            # 常驻工作线程：关闭前后各读一次
+            requests, results = [threading.Event(), threading.Event()], []
+
+            def worker():
+                for event in requests:
+                    event.wait()
+                    try:
+                        results.append(storage.get_task(task_id)['description'])
+                    except sqlite3.ProgrammingError:
+                        results.append("closed")
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            requests[0].set()
+            while not results:
+                time.sleep(0.01)
+
+            storage.close()
+
+            requests[1].set()
+            thread.join()
+            assert results == ["关闭测试", "closed"]
+
+            with pytest.raises(sqlite3.ProgrammingError):
+                storage.get_task(task_id)
+            with pytest.raises(sqlite3.ProgrammingError):
+                storage.create_task("关闭后写入", quadrant=0)
+            assert storage._read_conns == []
+        finally:
+            storage.close()
+            os.unlink(path)
+
+    def test_memory_database_reads(self):
+        """测试内存数据库的读取共用写连接，且在锁内进行"""
+        storage = Storage(":memory:")
+        try:
+            task_id = storage.create_task("内存测试", quadrant=1)
+            acquired = []
+
+            def try_lock():
+                if storage._lock.acquire(blocking=False):
+                    storage._lock.release()
+                    acquired.append(True)
+                else:
+                    acquired.append(False)
+
+            with storage.read_cursor() as cursor:
+                # 读取期间持有锁，其他线程无法写入
+                thread = threading.Thread(target=try_lock)
+                thread.start()
+                thread.join()
+                cursor.execute("SELECT description FROM tasks WHERE id = ?", (task_id,))
+                assert cursor.fetchone()['description'] == "内存测试"
+
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+            assert acquired == [False, True]
+        finally:
+            storage.close()
+
     def test_export_and_import(self, temp_db):
         """测试数据导出"""
         task_manager = TaskManager(temp_db)
@@ -7,7 +7,8 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.pomodoro_timer import PomodoroTimer, TimerState
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+from core.pomodoro_timer import PomodoroTimer, PomodoroTimerBase, QtPomodoroTimer, TimerState
 
 
 class TestPomodoroTimer:
@@ -24,6 +25,18 @@ class TestPomodoroTimer:
         assert not timer.is_running
         assert not timer.is_paused
 
+    def test_base_requires_worker_hooks(self):
+        """测试未实现计时驱动的子类无法实例化"""
+        with pytest.raises(TypeError):
+            PomodoroTimerBase()
+
+        class PartialTimer(PomodoroTimerBase):
+            def _start_worker(self):
+                pass
+
+        with pytest.raises(TypeError):
+            PartialTimer()
+
     def test_set_duration(self):
         """测试设置时长"""
         timer = PomodoroTimer()
@@ -122,6 +135,25 @@ class TestPomodoroTimer:
         assert timer.state == TimerState.READY
         assert timer.remaining_seconds == timer.duration
 
+    def test_stop_and_reset(self):
+        """测试废弃并重置只触发一次状态回调"""
+        timer = PomodoroTimer()
+        timer.set_duration(60)
+        timer.start()
+
+        states = []
+        timer.set_state_change_callback(states.append)
+
+        assert timer.stop_and_reset() is True
+        assert states == [TimerState.READY]
+        assert timer.state == TimerState.READY
+        assert timer.remaining_seconds == 60
+        assert timer.start_time is None
+
+        # 未在计时时只是保持初始状态
+        assert timer.stop_and_reset() is False
+        assert states == [TimerState.READY]
+
     def test_formatted_time(self):
         """测试格式化时间"""
         timer = PomodoroTimer()
@@ -204,6 +236,64 @@ class TestPomodoroTimer:
         assert len(completed_called) == 1
         assert timer.remaining_seconds == 0
 
+    def test_pause_does_not_consume_time(self):
+        """测试暂停期间不计入剩余时间"""
+        timer = PomodoroTimer()
+        timer.set_duration(5)
+        timer.start()
+
+        timer.pause()
+        time.sleep(1.5)
+        timer.resume()
+        time.sleep(0.3)
+
+        assert timer.remaining_seconds == 5
+
+        timer.stop()
+
+    def test_worker_thread_reused(self):
+        """测试多轮计时复用同一个计时线程"""
+        timer = PomodoroTimer()
+
+        timer.start()
+        worker = timer._timer_thread
+        timer.stop()
+
+        timer.start()
+        assert timer._timer_thread is worker
+        assert timer.is_running
+        timer.stop()
+
+        timer.shutdown()
+        worker.join(timeout=1.0)
+        assert not worker.is_alive()
+
+    def test_start_after_shutdown(self):
+        """测试 shutdown() 后立即开始会创建新的计时线程并正常计时"""
+        timer = PomodoroTimer()
+        timer.set_duration(60)
+
+        timer.start()
+        old_worker = timer._timer_thread
+        timer.stop()
+        timer.shutdown()
+
+        ticks = []
+        timer.set_tick_callback(lambda remaining, total: ticks.append(remaining))
+        assert timer.start() is True
+
+        assert not old_worker.is_alive()
+        assert timer._timer_thread is not old_worker
+        assert timer._timer_thread.is_alive()
+
+        deadline = time.monotonic() + 1.0
+        while not ticks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert ticks and ticks[0] == 60
+
+        timer.stop()
+        timer.shutdown()
+
     def test_double_start(self):
         """测试重复启动"""
         timer = PomodoroTimer()
@@ -243,5 +333,59 @@ class TestPomodoroTimer:
         timer.stop()
 
 
+@pytest.fixture
+def qt_app():
+    """提供Qt事件循环所需的应用实例"""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    yield app
+
+
+def run_event_loop(seconds: float):
+    """运行Qt事件循环指定时长"""
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec()
+
+
+class TestQtPomodoroTimer:
+    """Qt事件循环驱动的计时器测试类"""
+
+    def test_timer_completion(self, qt_app):
+        """测试计时器自动完成"""
+        timer = QtPomodoroTimer(duration_seconds=1)
+
+        tick_values = []
+        completed_called = []
+        timer.set_tick_callback(lambda remaining, total: tick_values.append(remaining))
+        timer.set_complete_callback(lambda: completed_called.append(True))
+
+        timer.start()
+        run_event_loop(1.5)
+
+        assert timer.state == TimerState.COMPLETED
+        assert timer.remaining_seconds == 0
+        assert tick_values == [1, 0]
+        assert len(completed_called) == 1
+
+    def test_pause_stops_ticking(self, qt_app):
+        """测试暂停后不再tick"""
+        timer = QtPomodoroTimer(duration_seconds=5)
+
+        tick_values = []
+        timer.set_tick_callback(lambda remaining, total: tick_values.append(remaining))
+
+        timer.start()
+        run_event_loop(0.2)
+        timer.pause()
+        ticks_before_pause = len(tick_values)
+        run_event_loop(1.2)
+
+        assert len(tick_values) == ticks_before_pause
+        assert timer.remaining_seconds == 5
+
+        timer.stop()
+        assert timer.state == TimerState.ABANDONED
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
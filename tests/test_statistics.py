@@ -86,6 +86,27 @@ class TestStatistics:
         assert monthly.total_pomodoros == 0
         assert monthly.days_with_pomodoros == 0
 
+    def test_monthly_statistics_with_data(self, temp_db, statistics):
+        """测试有数据时的月度统计与日历"""
+        for _ in range(2):
+            session_id = temp_db.create_pomodoro_session(None, "2026-01-05T09:00:00")
+            temp_db.end_pomodoro_session(session_id, "2026-01-05T09:30:00", TimerStatus.COMPLETED)
+
+        monthly = statistics.get_monthly_statistics(2026, 1)
+
+        assert monthly.days_with_data[5] == 2
+        assert monthly.total_pomodoros == 2
+        assert monthly.to_dict()['days_with_data'] == {"05": 2}
+
+        calendar_data = statistics.get_calendar_data(2026, 1)
+        assert 2 in [count for week in calendar_data for count in week]
+
+        # 新会话写入后缓存失效
+        session_id = temp_db.create_pomodoro_session(None, "2026-01-05T10:00:00")
+        temp_db.end_pomodoro_session(session_id, "2026-01-05T10:30:00", TimerStatus.COMPLETED)
+
+        assert statistics.get_monthly_statistics(2026, 1).days_with_data[5] == 3
+
     def test_weekly_statistics(self, statistics):
         """测试周统计"""
         weekly = statistics.get_weekly_statistics("2026-01-12")
@@ -112,6 +133,19 @@ class TestStatistics:
         assert stats['estimated_pomodoros'] == 5
         assert stats['actual_pomodoros'] == 3
 
+    def test_get_total_pomodoros(self, temp_db, statistics):
+        """测试番茄钟总数（含日期范围与缓存失效）"""
+        assert statistics.get_total_pomodoros() == 0
+
+        for start_time in ("2026-01-10T09:00:00", "2026-01-12T09:00:00"):
+            session_id = temp_db.create_pomodoro_session(None, start_time)
+            temp_db.end_pomodoro_session(session_id, start_time, TimerStatus.COMPLETED)
+
+        assert statistics.get_total_pomodoros() == 2
+        assert statistics.get_total_pomodoros("2026-01-11") == 1
+        assert statistics.get_total_pomodoros(end_date="2026-01-10") == 1
+        assert statistics.get_total_pomodoros("2026-01-10", "2026-01-12") == 2
+
     def test_get_productivity_streak_empty(self, statistics):
         """测试空数据的连续记录"""
         streak = statistics.get_productivity_streak()
@@ -70,6 +70,23 @@ class TestTaskManager:
         assert retrieved.id == created.id
         assert retrieved.description == "获取测试"
 
+    def test_get_task_cached(self, task_manager):
+        """测试缓存读取在任务修改后失效"""
+        task = task_manager.create_task("缓存测试", quadrant=0)
+        assert task_manager.get_task(task.id, cache=True).description == "缓存测试"
+
+        task_manager.update_task(task.id, description="新描述")
+        assert task_manager.get_task(task.id, cache=True).description == "新描述"
+
+        task_manager.increment_task_pomodoros(task.id)
+        assert task_manager.get_task(task.id, cache=True).actual_pomodoros == 1
+
+        task_manager.complete_task(task.id)
+        assert task_manager.get_task(task.id, cache=True).is_completed is True
+
+        task_manager.delete_task(task.id)
+        assert task_manager.get_task(task.id, cache=True) is None
+
     def test_get_nonexistent_task(self, task_manager):
         """测试获取不存在的任务"""
         task = task_manager.get_task(99999)
@@ -90,6 +107,47 @@ class TestTaskManager:
         assert len(q1_tasks) == 1
         assert q1_tasks[0].description == "重要不紧急"
 
+    def test_get_tasks_grouped_by_quadrant(self, task_manager):
+        """测试一次获取按象限分组的任务"""
+        task_manager.create_task("Q1任务1", quadrant=0)
+        task_manager.create_task("Q1任务2", quadrant=0)
+        t3 = task_manager.create_task("Q3任务", quadrant=2)
+        task_manager.complete_task(t3.id)
+
+        grouped = task_manager.get_tasks_grouped_by_quadrant()
+
+        assert set(grouped) == {0, 1, 2, 3}
+        assert [t.description for t in grouped[0]] == [
+            t.description for t in task_manager.get_tasks_by_quadrant(0)
+        ]
+        assert grouped[1] == []
+        assert grouped[2] == []
+
+        grouped = task_manager.get_tasks_grouped_by_quadrant(include_completed=True)
+        assert [t.id for t in grouped[2]] == [t3.id]
+
+    def test_version_bumped_on_write(self, task_manager):
+        """测试任务写入后版本号递增，读取不改变版本号"""
+        v0 = task_manager.version
+        task = task_manager.create_task("版本测试", quadrant=0)
+        v1 = task_manager.version
+        assert v1 > v0
+
+        task_manager.get_tasks_grouped_by_quadrant()
+        task_manager.get_task(task.id, cache=True)
+        assert task_manager.version == v1
+
+        task_manager.update_task(task.id, description="新描述")
+        v2 = task_manager.version
+        assert v2 > v1
+
+        task_manager.complete_task(task.id)
+        v3 = task_manager.version
+        assert v3 > v2
+
+        task_manager.delete_task(task.id)
+        assert task_manager.version > v3
+
     def test_update_task(self, task_manager):
         """测试更新任务"""
         task = task_manager.create_task("原描述", quadrant=0, estimated_pomodoros=2)
@@ -125,6 +183,31 @@ class TestTaskManager:
         moved = task_manager.get_task(task.id)
         assert moved.quadrant == 2
 
+    def test_move_task_rejected(self, task_manager):
+        """测试无法移动的情况"""
+        task = task_manager.create_task("移动测试", quadrant=0)
+
+        # 已经在目标象限
+        assert task_manager.move_task_to_quadrant(task.id, new_quadrant=0) is False
+
+        with pytest.raises(ValueError):
+            task_manager.move_task_to_quadrant(99999, new_quadrant=1)
+
+        task_manager.complete_task(task.id)
+        with pytest.raises(ValueError):
+            task_manager.move_task_to_quadrant(task.id, new_quadrant=1)
+
+    def test_mutate_nonexistent_task(self, task_manager):
+        """测试操作不存在的任务"""
+        with pytest.raises(ValueError):
+            task_manager.update_task(99999, description="新描述")
+
+        with pytest.raises(ValueError):
+            task_manager.complete_task(99999)
+
+        with pytest.raises(ValueError):
+            task_manager.delete_task(99999)
+
     def test_complete_task(self, task_manager):
         """测试完成任务"""
         task = task_manager.create_task("完成测试", quadrant=1)
@@ -137,6 +220,9 @@ class TestTaskManager:
         assert completed.is_completed is True
         assert completed.completed_date is not None
 
+        # 重复完成不再更新
+        assert task_manager.complete_task(task.id) is False
+
     def test_get_completed_tasks(self, task_manager):
         """测试获取已完成任务"""
         t1 = task_manager.create_task("任务1", quadrant=0)
@@ -170,6 +256,9 @@ class TestTaskManager:
         updated = task_manager.get_task(task.id)
         assert updated.actual_pomodoros == 2
 
+        task_manager.increment_task_pomodoros(task.id, count=3)
+        assert task_manager.get_task(task.id).actual_pomodoros == 5
+
     def test_get_task_duration_days(self, task_manager):
         """测试计算任务持续天数"""
         task = task_manager.create_task("持续测试", quadrant=0)
@@ -202,6 +291,8 @@ class TestTaskManager:
         assert TaskManager.get_quadrant_name(1) == "重要不紧急"
         assert TaskManager.get_quadrant_name(2) == "紧急不重要"
         assert TaskManager.get_quadrant_name(3) == "不紧急不重要"
+        assert TaskManager.get_quadrant_name(-1) == "未知"
+        assert TaskManager.get_quadrant_name(4) == "未知"
 
     def test_get_quadrant_color(self):
         """测试获取象限颜色"""
@@ -209,6 +300,7 @@ class TestTaskManager:
         assert TaskManager.get_quadrant_color(1) == "#FFD93D"
         assert TaskManager.get_quadrant_color(2) == "#4D96FF"
         assert TaskManager.get_quadrant_color(3) == "#A0A0A0"
+        assert TaskManager.get_quadrant_color(4) == "#808080"
 
 
 if __name__ == "__main__":
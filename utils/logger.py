@@ -1,6 +1,6 @@
 """日志工具 - 记录和检索日志。"""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Mapping, Optional
 from datetime import datetime
 from data.storage import Storage
 
@@ -24,17 +24,17 @@ class LogEntry:
         self.content = content
         self.timestamp = timestamp
         self.task_id = task_id
-        self.date = date or datetime.fromisoformat(timestamp).strftime("%Y-%m-%d")
+        self.date = date or timestamp[:10]
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'LogEntry':
-        """从字典创建LogEntry对象"""
+    def from_dict(cls, data: Mapping) -> 'LogEntry':
+        """从字典或 sqlite3.Row 创建LogEntry对象（需包含 logs 表全部列）"""
         return cls(
             log_id=data['id'],
             content=data['content'],
             timestamp=data['timestamp'],
-            task_id=data.get('task_id'),
-            date=data.get('date')
+            task_id=data['task_id'],
+            date=data['date']
         )
 
     def to_dict(self) -> Dict:
@@ -92,11 +92,11 @@ class Logger:
             return LogEntry.from_dict(log_entry)
 
         # 回退：直接从数据库获取
-        cursor = self.storage.conn.cursor()
-        cursor.execute("SELECT * FROM logs WHERE id = ?", (log_id,))
-        row = cursor.fetchone()
+        with self.storage.read_cursor() as cursor:
+            cursor.execute("SELECT * FROM logs WHERE id = ?", (log_id,))
+            row = cursor.fetchone()
         if row:
-            return LogEntry.from_dict(dict(row))
+            return LogEntry.from_dict(row)
         else:
             raise ValueError(f"无法找到日志记录: {log_id}")
 
@@ -136,14 +136,14 @@ class Logger:
         Returns:
             日志列表
         """
-        cursor = self.storage.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM logs
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (limit,))
+        with self.storage.read_cursor() as cursor:
+            cursor.execute("""
+                SELECT * FROM logs
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (limit,))
 
-        return [LogEntry.from_dict(dict(row)) for row in cursor.fetchall()]
+            return [LogEntry.from_dict(row) for row in cursor.fetchall()]
 
     def get_today_logs(self) -> List[LogEntry]:
         """
@@ -166,19 +166,18 @@ class Logger:
         Returns:
             匹配的日志列表
         """
-        cursor = self.storage.conn.cursor()
-
-        if date:
-            cursor.execute("""
-                SELECT * FROM logs
-                WHERE date = ? AND content LIKE ?
-                ORDER BY timestamp DESC
-            """, (date, f"%{keyword}%"))
-        else:
-            cursor.execute("""
-                SELECT * FROM logs
-                WHERE content LIKE ?
-                ORDER BY timestamp DESC
-            """, (f"%{keyword}%",))
-
-        return [LogEntry.from_dict(dict(row)) for row in cursor.fetchall()]
+        with self.storage.read_cursor() as cursor:
+            if date:
+                cursor.execute("""
+                    SELECT * FROM logs
+                    WHERE date = ? AND content LIKE ?
+                    ORDER BY timestamp DESC
+                """, (date, f"%{keyword}%"))
+            else:
+                cursor.execute("""
+                    SELECT * FROM logs
+                    WHERE content LIKE ?
+                    ORDER BY timestamp DESC
+                """, (f"%{keyword}%",))
+
+            return [LogEntry.from_dict(row) for row in cursor.fetchall()]